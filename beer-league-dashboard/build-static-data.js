@@ -96,7 +96,7 @@ class StaticDataBuilder {
                         total_bench_points: parseFloat(row.total_bench_points),
                         bench_player_count: parseInt(row.bench_player_count),
                         date_recorded: row.date_recorded,
-                        bench_players_json: row.bench_players_detail || '[]'
+                        bench_players: this.parseBenchPlayers(row.bench_players_detail)
                     };
 
                     results.push(weeklyResult);
@@ -231,23 +231,27 @@ class StaticDataBuilder {
         );
     }
 
-    getBenchPlayersForTeam(rosterId, week) {
-        const weeklyResult = this.weeklyResults.find(r => 
-            r.roster_id === rosterId && r.week === week
-        );
-        
-        if (!weeklyResult || !weeklyResult.bench_players_json) {
+    parseBenchPlayers(benchPlayersDetail) {
+        if (!benchPlayersDetail) {
             return [];
         }
 
         try {
-            const players = JSON.parse(weeklyResult.bench_players_json);
+            const players = JSON.parse(benchPlayersDetail);
             return Array.isArray(players) ? players : [];
         } catch (e) {
             return [];
         }
     }
 
+    getBenchPlayersForTeam(rosterId, week) {
+        const weeklyResult = this.weeklyResults.find(r => 
+            r.roster_id === rosterId && r.week === week
+        );
+        
+        return weeklyResult ? weeklyResult.bench_players : [];
+    }
+
     async generateAnalytics() {
         const weeks = [...new Set(this.weeklyResults.map(r => r.week))].sort((a, b) => a - b);
         const totalTeams = this.teams.size;
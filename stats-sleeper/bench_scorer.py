@@ -1,14 +1,16 @@
 """
 Core bench scoring logic and API integration.
 """
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import asdict, dataclass
 from datetime import datetime
+import json
+import os
 import time
 from sleeper_wrapper import League
 from get_matchups import get_matchups_for_week, get_league_info, get_current_week
-from get_rosters import get_roster_owners, get_users_mapping
-from player_lookup import lookup_player_info, PlayerInfo
+from get_rosters import get_league_snapshot, get_roster_owners, get_users_mapping
+from player_lookup import get_all_players, lookup_player_info, PlayerInfo
 from config import config
 
 @dataclass
@@ -89,17 +91,32 @@ class BenchScorer:
         self.league = League(league_id)
         self.roster_owners = {}
         self.users_mapping = {}
+        self._rosters_by_id: Optional[Dict[int, Dict]] = None
         self._load_league_data()
     
     def _load_league_data(self):
         """Load league data including roster owners and users."""
         try:
-            self.roster_owners = get_roster_owners(self.league_id)
-            self.users_mapping = get_users_mapping(self.league_id)
+            snapshot = get_league_snapshot(self.league_id)
+            self.roster_owners = get_roster_owners(self.league_id, snapshot)
+            self.users_mapping = get_users_mapping(self.league_id, snapshot)
             print(f"Loaded data for {len(self.roster_owners)} teams")
         except Exception as e:
             print(f"Error loading league data: {e}")
     
+    def get_rosters_by_id(self, refresh: bool = False) -> Dict[int, Dict]:
+        """Fetch league rosters keyed by roster_id, reusing the last fetch unless refresh is set."""
+        if refresh or self._rosters_by_id is None:
+            rosters = self.league.get_rosters() or []
+            self._rosters_by_id = {roster.get('roster_id'): roster for roster in rosters if roster.get('roster_id')}
+        return self._rosters_by_id
+    
+    def prefetch_players(self) -> Dict[str, PlayerInfo]:
+        """Load the full NFL player map up front so later lookups are local dict hits."""
+        # Sleeper serves every player from one endpoint; PlayerLookup fetches it once
+        # and keeps it on disk for 24h, so this never costs more than a single request
+        return get_all_players()
+    
     def get_league_info(self) -> Optional[Dict]:
         """Fetch league metadata and settings."""
         return get_league_info(self.league_id)
@@ -129,13 +146,16 @@ class BenchScorer:
             return []
         
         # Convert to sets for efficient comparison
-        roster_set = set(roster_players)
-        starters_set = set(starters)
-        reserve_set = set(reserve_players) if reserve_players else set()
+        reserve_set = frozenset(reserve_players) if reserve_players else frozenset()
+        return list(self.identify_bench_players_sets(frozenset(roster_players), frozenset(starters), reserve_set))
+    
+    def identify_bench_players_sets(self, roster_set: AbstractSet[str], starters_set: AbstractSet[str], reserve_set: AbstractSet[str] = frozenset()) -> FrozenSet[str]:
+        """Set form of identify_bench_players for callers that already hold the roster as sets."""
+        if not roster_set or not starters_set:
+            return frozenset()
         
         # Bench players are those in roster but not in starters and not in IR (reserve)
-        bench_players = list(roster_set - starters_set - reserve_set)
-        return bench_players
+        return frozenset(roster_set - starters_set - reserve_set)
     
     def calculate_bench_points(self, bench_player_ids: List[str], players_points: Dict[str, float]) -> float:
         """Sum bench points from players_points dict."""
@@ -149,22 +169,71 @@ class BenchScorer:
         
         return round(total_points, 2)
     
+    def _bench_cache_path(self, week: int) -> str:
+        """Get cache file path for a completed week's bench results."""
+        return config.get_data_path(os.path.join('sleeper_cache', f'bench_{self.league_id}_week{week}.json'))
+    
+    def _load_cached_week(self, week: int) -> Optional[List[WeeklyBenchResult]]:
+        """Load cached bench results for a completed week, if present."""
+        try:
+            with open(self._bench_cache_path(week), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return [
+                WeeklyBenchResult(**{
+                    **result,
+                    'bench_players': [BenchPlayer(**player) for player in result['bench_players']],
+                    'date_recorded': datetime.fromisoformat(result['date_recorded'])
+                })
+                for result in cached
+            ]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable bench cache for week {week}: {e}")
+            return None
+    
+    def _cache_week(self, week: int, weekly_results: List[WeeklyBenchResult]) -> None:
+        """Persist bench results for a week that can no longer change."""
+        cache_path = self._bench_cache_path(week)
+        cache_data = [
+            {**asdict(result), 'date_recorded': result.date_recorded.isoformat()}
+            for result in weekly_results
+        ]
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache_data, f)
+        except OSError as e:
+            print(f"Error caching bench results for week {week}: {e}")
+    
     def process_week_bench_scores(self, week: int) -> List[WeeklyBenchResult]:
         """Process entire week and return bench results for all teams."""
+        # Completed weeks never change, so their results are memoized on disk;
+        # set BENCH_CACHE_BUST=1 to recompute them (e.g. after changing scoring logic)
+        if config.cache_api_responses and not config.bench_cache_bust:
+            cached = self._load_cached_week(week)
+            if cached is not None:
+                return cached
+        
+        weekly_results = self._compute_week_bench_scores(week)
+        
+        if weekly_results and config.cache_api_responses:
+            current_week = get_current_week()
+            if current_week and week < current_week:
+                self._cache_week(week, weekly_results)
+        
+        return weekly_results
+    
+    def _compute_week_bench_scores(self, week: int) -> List[WeeklyBenchResult]:
+        """Fetch a week's matchups from Sleeper and score every team's bench."""
         try:
             matchups = get_matchups_for_week(self.league_id, week)
             if not matchups:
                 print(f"No matchups found for week {week}")
                 return []
             
-            # Get roster data to access reserve (IR) players
-            rosters = self.league.get_rosters()
-            roster_reserve_map = {}
-            for roster in rosters:
-                roster_id = roster.get('roster_id')
-                reserve_players = roster.get('reserve', [])
-                if roster_id:
-                    roster_reserve_map[roster_id] = reserve_players
+            # Get roster data to access reserve (IR) players and owners
+            rosters_by_id = self.get_rosters_by_id()
             
             weekly_results = []
             
@@ -179,36 +248,34 @@ class BenchScorer:
                 players_points = matchup.get('players_points', {})
                 
                 # Get reserve (IR) players for this roster
-                reserve_players = roster_reserve_map.get(roster_id, [])
-                
-                # Identify bench players (excluding IR players)
-                bench_player_ids = self.identify_bench_players(players, starters, reserve_players)
+                roster = rosters_by_id.get(roster_id, {})
+                reserve_players = roster.get('reserve', [])
                 
-                # Calculate bench points
-                total_bench_points = self.calculate_bench_points(bench_player_ids, players_points)
+                # Identify bench players (excluding IR players). players_points is keyed
+                # by every rostered player, so its keys view can stand in for the roster set.
+                if players and starters and len(players_points) == len(players):
+                    bench_player_ids = list(players_points.keys() - set(starters) - set(reserve_players or ()))
+                else:
+                    bench_player_ids = self.identify_bench_players(players, starters, reserve_players)
                 
                 # Get team/owner info
                 team_name = self.roster_owners.get(roster_id, f'Team_{roster_id}')
                 
                 # Find owner_id from roster data
-                owner_id = None
-                try:
-                    rosters = self.league.get_rosters()
-                    for roster in rosters:
-                        if roster.get('roster_id') == roster_id:
-                            owner_id = roster.get('owner_id')
-                            break
-                except Exception as e:
-                    print(f"Error getting owner_id for roster {roster_id}: {e}")
-                
+                owner_id = roster.get('owner_id')
                 if not owner_id:
                     owner_id = f'owner_{roster_id}'
                 
-                # Create bench player objects with detailed info
+                # Create bench player objects with detailed info, accumulating bench points
+                # in the same pass (same result as calculate_bench_points, without a second
+                # walk over the ids and a second round of float conversion)
                 bench_players = []
+                total_bench_points = 0.0
                 for player_id in bench_player_ids:
                     player_info = lookup_player_info(player_id)
                     points = players_points.get(player_id, 0.0)
+                    points = float(points) if isinstance(points, (int, float)) else 0.0
+                    total_bench_points += points
                     
                     if player_info:
                         bench_player = BenchPlayer(
@@ -216,7 +283,7 @@ class BenchScorer:
                             player_name=player_info.name,
                             position=player_info.position,
                             team=player_info.team,
-                            points=float(points) if isinstance(points, (int, float)) else 0.0,
+                            points=points,
                             week=week,
                             roster_id=roster_id,
                             owner_id=owner_id
@@ -227,7 +294,7 @@ class BenchScorer:
                             player_name=f'Player_{player_id}',
                             position='UNK',
                             team='UNK',
-                            points=float(points) if isinstance(points, (int, float)) else 0.0,
+                            points=points,
                             week=week,
                             roster_id=roster_id,
                             owner_id=owner_id
@@ -242,7 +309,7 @@ class BenchScorer:
                     owner_id=owner_id,
                     team_name=team_name,
                     bench_players=bench_players,
-                    total_bench_points=total_bench_points,
+                    total_bench_points=round(total_bench_points, 2),
                     bench_player_count=len(bench_players),
                     date_recorded=datetime.now()
                 )
@@ -16,6 +16,9 @@ class Config:
         self.data_dir = os.getenv('DATA_DIR', 'data')
         self.cache_players = os.getenv('CACHE_PLAYERS', 'true').lower() == 'true'
         self.player_cache_file = os.getenv('PLAYER_CACHE_FILE', 'player_cache.json')
+        self.cache_api_responses = os.getenv('CACHE_API_RESPONSES', 'true').lower() == 'true'
+        self.api_cache_ttl = int(os.getenv('API_CACHE_TTL', '3600'))
+        self.bench_cache_bust = os.getenv('BENCH_CACHE_BUST', 'false').lower() in ('1', 'true')
         self.api_timeout = int(os.getenv('API_TIMEOUT', '30'))
         self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
         
@@ -5,12 +5,35 @@ Debug script to understand Sleeper roster slot structure and IR player identific
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 from sleeper_wrapper import League
 from config import config
 
-def debug_roster_structure():
+SLEEPER_API_URL = "https://api.sleeper.app/v1"
+
+def _fetch_all(league_id: str) -> Tuple[Optional[int], Dict]:
+    """Fire the independent Sleeper GETs concurrently.
+    
+    Returns the current week and a dict of futures keyed by endpoint. The
+    matchups request depends on the current week so it is chained behind it.
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            'rosters': executor.submit(requests.get, f"{SLEEPER_API_URL}/league/{league_id}/rosters"),
+            'league': executor.submit(requests.get, f"{SLEEPER_API_URL}/league/{league_id}"),
+        }
+        current_week = get_current_week()
+        if current_week:
+            futures['matchups'] = executor.submit(
+                requests.get, f"{SLEEPER_API_URL}/league/{league_id}/matchups/{current_week}"
+            )
+    return current_week, futures
+
+def debug_roster_structure(fetched: Optional[Tuple[Optional[int], Dict]] = None):
     """Debug the structure of roster data from Sleeper API."""
     league_id = config.league_id
+    current_week, futures = fetched or _fetch_all(league_id)
     
     print(f"Debugging roster structure for league: {league_id}")
     print("=" * 60)
@@ -34,8 +57,7 @@ def debug_roster_structure():
     try:
         # Method 2: Direct API call to rosters endpoint
         print(f"\n2. Direct API call to rosters endpoint:")
-        url = f"https://api.sleeper.app/v1/league/{league_id}/rosters"
-        response = requests.get(url)
+        response = futures['rosters'].result()
         
         if response.status_code == 200:
             rosters_data = response.json()
@@ -52,10 +74,8 @@ def debug_roster_structure():
     try:
         # Method 3: Check matchup data structure for roster info
         print(f"\n3. Checking matchup data for roster slot info:")
-        current_week = get_current_week()
         if current_week:
-            matchup_url = f"https://api.sleeper.app/v1/league/{league_id}/matchups/{current_week}"
-            response = requests.get(matchup_url)
+            response = futures['matchups'].result()
             
             if response.status_code == 200:
                 matchups = response.json()
@@ -72,21 +92,23 @@ def debug_roster_structure():
 def get_current_week():
     """Get current NFL week."""
     try:
-        response = requests.get("https://api.sleeper.app/v1/state/nfl")
+        response = requests.get(f"{SLEEPER_API_URL}/state/nfl")
         if response.status_code == 200:
             return response.json().get("week")
     except:
         pass
     return None
 
-def debug_league_settings():
+def debug_league_settings(fetched: Optional[Tuple[Optional[int], Dict]] = None):
     """Check league settings for roster configuration."""
     league_id = config.league_id
     
     try:
         print(f"\n4. League settings and roster configuration:")
-        url = f"https://api.sleeper.app/v1/league/{league_id}"
-        response = requests.get(url)
+        if fetched:
+            response = fetched[1]['league'].result()
+        else:
+            response = requests.get(f"{SLEEPER_API_URL}/league/{league_id}")
         
         if response.status_code == 200:
             league_data = response.json()
@@ -103,5 +125,6 @@ def debug_league_settings():
         print(f"Error getting league settings: {e}")
 
 if __name__ == "__main__":
-    debug_roster_structure()
-    debug_league_settings()
+    fetched = _fetch_all(config.league_id)
+    debug_roster_structure(fetched)
+    debug_league_settings(fetched)
@@ -3,23 +3,82 @@ import requests
 from sleeper_wrapper import League
 import argparse
 import json
+import os
+import time
 from typing import List, Dict, Optional
+from config import config
+
+# (fetched_at, week) from the last successful state/nfl request
+_current_week_cache = None
 
 def get_current_week():
     """Gets the current NFL week from the Sleeper API."""
+    global _current_week_cache
+    
+    # The week only advances once a week; reuse the last answer within the cache TTL
+    if config.cache_api_responses and _current_week_cache is not None:
+        fetched_at, week = _current_week_cache
+        if time.time() - fetched_at < config.api_cache_ttl:
+            return week
+    
     try:
         response = requests.get("https://api.sleeper.app/v1/state/nfl")
         response.raise_for_status()  # Raise an exception for bad status codes
-        return response.json()["week"]
+        week = response.json()["week"]
+        _current_week_cache = (time.time(), week)
+        return week
     except requests.exceptions.RequestException as e:
         print(f"Error getting current week: {e}")
         return None
 
+def _matchup_cache_path(league_id: str, week: int) -> str:
+    """Get cache file path for a league/week matchups response."""
+    return config.get_data_path(os.path.join('sleeper_cache', f'matchups_{league_id}_week{week}.json'))
+
+def _load_cached_matchups(league_id: str, week: int) -> Optional[List[Dict]]:
+    """Load cached matchups if the week is finalized or the entry is still fresh."""
+    cache_path = _matchup_cache_path(league_id, week)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache_data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    
+    # Completed weeks never change; in-progress weeks expire after the TTL
+    cache_age = time.time() - cache_data.get('timestamp', 0)
+    if cache_data.get('final') or cache_age < config.api_cache_ttl:
+        return cache_data.get('matchups')
+    return None
+
+def _cache_matchups(league_id: str, week: int, matchups: List[Dict]) -> None:
+    """Persist a matchups response, marking it final once the week is over."""
+    current_week = get_current_week()
+    cache_data = {
+        'timestamp': time.time(),
+        'final': bool(current_week) and week < current_week,
+        'matchups': matchups
+    }
+    
+    cache_path = _matchup_cache_path(league_id, week)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f)
+    except OSError as e:
+        print(f"Error caching matchups for week {week}: {e}")
+
 def get_matchups_for_week(league_id: str, week: int) -> List[Dict]:
     """Get matchups for a specific week."""
+    if config.cache_api_responses:
+        cached = _load_cached_matchups(league_id, week)
+        if cached is not None:
+            return cached
+    
     try:
         league = League(league_id)
         matchups = league.get_matchups(week)
+        if matchups and config.cache_api_responses:
+            _cache_matchups(league_id, week, matchups)
         return matchups if matchups else []
     except Exception as e:
         print(f"Error getting matchups for week {week}: {e}")
@@ -2,23 +2,25 @@
 from sleeper_wrapper import League
 import argparse
 import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-def get_roster_owners(league_id: str) -> Dict[int, str]:
+def _user_names(users: List[Dict]) -> Dict[str, str]:
+    """Map user_id to display name, falling back to username."""
+    return {
+        user.get('user_id'): user.get('display_name') or user.get('username', f"User_{user.get('user_id')}")
+        for user in users
+    }
+
+def get_league_snapshot(league_id: str) -> Tuple[List[Dict], List[Dict]]:
+    """Fetch (users, rosters) with a single League instance and one call each."""
+    league = League(league_id)
+    return league.get_users() or [], league.get_rosters() or []
+
+def get_roster_owners(league_id: str, snapshot: Optional[Tuple[List[Dict], List[Dict]]] = None) -> Dict[int, str]:
     """Map roster_id to owner info (display name or username)."""
     try:
-        league = League(league_id)
-        
-        # Get users and rosters
-        users = league.get_users()
-        rosters = league.get_rosters()
-        
-        # Create mapping from user_id to display name
-        user_names = {}
-        for user in users:
-            user_id = user.get('user_id')
-            display_name = user.get('display_name') or user.get('username', f'User_{user_id}')
-            user_names[user_id] = display_name
+        users, rosters = snapshot or get_league_snapshot(league_id)
+        user_names = _user_names(users)
         
         # Create mapping from roster_id to owner name
         roster_owners = {}
@@ -34,19 +36,11 @@ def get_roster_owners(league_id: str) -> Dict[int, str]:
         print(f"Error getting roster owners: {e}")
         return {}
 
-def get_users_mapping(league_id: str) -> Dict[str, str]:
+def get_users_mapping(league_id: str, snapshot: Optional[Tuple[List[Dict], List[Dict]]] = None) -> Dict[str, str]:
     """Map owner_id to display names."""
     try:
-        league = League(league_id)
-        users = league.get_users()
-        
-        user_mapping = {}
-        for user in users:
-            user_id = user.get('user_id')
-            display_name = user.get('display_name') or user.get('username', f'User_{user_id}')
-            user_mapping[user_id] = display_name
-        
-        return user_mapping
+        users = snapshot[0] if snapshot else League(league_id).get_users()
+        return _user_names(users or [])
         
     except Exception as e:
         print(f"Error getting users mapping: {e}")
@@ -2,16 +2,94 @@
 JSON export functionality for dashboard integration.
 Generates dashboard-ready JSON files directly from bench scoring data.
 """
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 from bench_scorer import WeeklyBenchResult, BenchMatchup, SeasonBenchStandings
 from config import config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_print_lock = threading.Lock()
+
+def _report(message: str) -> None:
+    """Print a progress line without interleaving output from concurrent exports."""
+    with _print_lock:
+        print(message)
+
+def _json_default(obj: Any) -> Any:
+    """Serialize datetimes for the stdlib json fallback."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _encode(obj: Any) -> bytes:
+    """Encode obj as indented JSON bytes, using orjson when available.
+    
+    The dashboard fetches these files as plain JSON, so a binary format such as msgpack
+    is not an option here; orjson also indents natively, unlike msgspec's encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # json.dump streams one write() per token; serialize up front instead
+    return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+
+@contextmanager
+def _atomic_open(filepath: str) -> Iterator[BinaryIO]:
+    """Open a temp file beside filepath and rename it into place once fully written.
+    
+    The dashboard may read the exports at any time; os.replace is atomic on POSIX,
+    so readers see either the previous file or the complete new one, never a partial write.
+    """
+    tmp_path = filepath + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            yield f
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _dump(obj: Any, filepath: str) -> None:
+    """Write obj to filepath as indented JSON in a single write."""
+    data = _encode(obj)
+    with _atomic_open(filepath) as f:
+        f.write(data)
+
+def _dump_rows(rows: Iterable[Any], filepath: str) -> None:
+    """Stream rows to filepath as an indented JSON array without materializing the list.
+    
+    Output is byte-identical to _dump(list(rows), filepath): encoded JSON never contains
+    a raw newline inside a value, so each row is indented one level by prefixing its lines.
+    """
+    with _atomic_open(filepath) as f:
+        first = True
+        for row in rows:
+            f.write(b'[\n  ' if first else b',\n  ')
+            f.write(_encode(row).replace(b'\n', b'\n  '))
+            first = False
+        f.write(b'[]' if first else b'\n]')
+
 class JSONExporter:
     """Export bench scoring data to JSON format for static dashboard."""
     
+    EXPORT_FILES = ('standings.json', 'matchups.json', 'analytics.json', 'teams.json', 'weekly-results.json')
+    DIGEST_FILE = '.export_digest'
+    # Hashed with the inputs; bump whenever the exported JSON changes shape or
+    # content for the same inputs, so the next run rewrites the files
+    EXPORT_SCHEMA_VERSION = 1
+    
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
         self.ensure_data_dir()
@@ -25,19 +103,61 @@ class JSONExporter:
         """Get full path for data file."""
         return os.path.join(self.data_dir, filename)
     
-    def export_all_data(self, weekly_results: List[WeeklyBenchResult], matchups: List[BenchMatchup], standings: List[SeasonBenchStandings]) -> None:
+    def _export_digest(self, weekly_results: List[WeeklyBenchResult], matchups: List[BenchMatchup], standings: List[SeasonBenchStandings]) -> str:
+        """Hash the export inputs and schema version so unchanged data can skip re-serialization.
+        
+        The inputs are encoded with the same JSON encoder as the exported files, so the
+        digest depends only on the data, not on the interpreter or pickle version.
+        """
+        payload = _encode([
+            self.EXPORT_SCHEMA_VERSION,
+            [asdict(result) for result in weekly_results],
+            [asdict(matchup) for matchup in matchups],
+            [asdict(standing) for standing in standings],
+        ])
+        return hashlib.blake2b(payload).hexdigest()
+    
+    def _is_export_current(self, digest: str) -> bool:
+        """Check whether the last export used the same inputs and its files still exist."""
+        try:
+            with open(self.get_file_path(self.DIGEST_FILE), 'r', encoding='utf-8') as f:
+                if f.read().strip() != digest:
+                    return False
+        except OSError:
+            return False
+        
+        return all(os.path.exists(self.get_file_path(name)) for name in self.EXPORT_FILES)
+    
+    def export_all_data(self, weekly_results: List[WeeklyBenchResult], matchups: List[BenchMatchup], standings: List[SeasonBenchStandings], force: bool = False) -> None:
         """Export all data to JSON files for dashboard."""
+        digest = self._export_digest(weekly_results, matchups, standings)
+        if not force and self._is_export_current(digest):
+            print("📊 Dashboard JSON is up to date, skipping export")
+            return
+        
         print("📊 Exporting JSON data for dashboard...")
         
         # Extract teams data
         teams = self._extract_teams_data(weekly_results)
         
-        # Generate all JSON files
-        self.export_standings(standings)
-        self.export_matchups(matchups, teams, weekly_results)
-        self.export_analytics(weekly_results, matchups, standings)
-        self.export_teams(teams)
-        self.export_weekly_results(weekly_results)
+        # Standings and analytics share the same per-team dicts; build them once
+        standings_data = self._standings_to_dicts(standings)
+        
+        # Generate all JSON files concurrently; each export only reads the shared inputs
+        # and writes its own file, so serialization overlaps with disk writeback
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(self.export_standings, standings, standings_data),
+                executor.submit(self.export_matchups, matchups, teams, weekly_results),
+                executor.submit(self.export_analytics, weekly_results, matchups, standings, standings_data),
+                executor.submit(self.export_teams, teams),
+                executor.submit(self.export_weekly_results, weekly_results)
+            ]
+            for future in futures:
+                future.result()
+        
+        with _atomic_open(self.get_file_path(self.DIGEST_FILE)) as f:
+            f.write(digest.encode('ascii'))
         
         print("✅ JSON export complete!")
     
@@ -55,208 +175,215 @@ class JSONExporter:
         
         return teams
     
-    def export_standings(self, standings: List[SeasonBenchStandings]) -> None:
-        """Export standings data to JSON."""
-        standings_data = []
-        
-        for standing in standings:
-            standings_data.append({
+    def _standings_to_dicts(self, standings: List[SeasonBenchStandings]) -> List[Dict]:
+        """Convert standings to the dashboard format shared by standings and analytics."""
+        rnd = round
+        return [
+            {
                 'team': {
                     'roster_id': standing.roster_id,
                     'team_name': standing.team_name,
                     'owner_id': standing.owner_id
                 },
-                'total_points': round(standing.total_bench_points, 2),
-                'average_points': round(standing.average_bench_points, 2),
+                'total_points': rnd(standing.total_bench_points, 2),
+                'average_points': rnd(standing.average_bench_points, 2),
                 'weeks_played': standing.total_weeks,
-                'best_week': round(standing.best_week_points, 2),
-                'worst_week': round(standing.worst_week_points, 2),
+                'best_week': rnd(standing.best_week_points, 2),
+                'worst_week': rnd(standing.worst_week_points, 2),
                 'wins': standing.wins,
                 'losses': standing.losses,
-                'win_percentage': round(standing.win_percentage, 3)
-            })
+                'win_percentage': rnd(standing.win_percentage, 3)
+            }
+            for standing in standings
+        ]
+    
+    def export_standings(self, standings: List[SeasonBenchStandings], standings_data: Optional[List[Dict]] = None) -> None:
+        """Export standings data to JSON."""
+        if standings_data is None:
+            standings_data = self._standings_to_dicts(standings)
         
         filepath = self.get_file_path('standings.json')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(standings_data, f, indent=2)
+        _dump(standings_data, filepath)
         
-        print(f"📈 Exported standings data to {filepath}")
+        _report(f"📈 Exported standings data to {filepath}")
     
     def export_matchups(self, matchups: List[BenchMatchup], teams: Dict[int, Dict], weekly_results: List[WeeklyBenchResult] = None) -> None:
         """Export matchups data to JSON."""
-        matchups_data = []
+        # Index weekly results once so each team lookup is O(1) instead of a scan
+        results_by_key = {}
+        for result in weekly_results or []:
+            results_by_key.setdefault((result.roster_id, result.week), result)
+        bench_cache = {}
         
-        for i, matchup in enumerate(matchups):
-            team1 = teams.get(matchup.team1_roster_id, {})
-            team2 = teams.get(matchup.team2_roster_id, {})
-            winner = teams.get(matchup.winner_roster_id, {}) if matchup.winner_roster_id else None
-            
-            # Get bench players for both teams
-            team1_bench_players = self._get_bench_players_for_matchup(matchup.team1_roster_id, matchup.week, weekly_results or [])
-            team2_bench_players = self._get_bench_players_for_matchup(matchup.team2_roster_id, matchup.week, weekly_results or [])
-            
-            matchup_data = {
-                'id': i + 1,
-                'week': matchup.week,
-                'matchup_id': matchup.matchup_id,
-                'team1': {
-                    'roster_id': matchup.team1_roster_id,
-                    'team_name': matchup.team1_name,
-                    'bench_points': round(matchup.team1_bench_points, 2),
-                    'bench_players': team1_bench_players
-                },
-                'team2': {
-                    'roster_id': matchup.team2_roster_id,
-                    'team_name': matchup.team2_name,
-                    'bench_points': round(matchup.team2_bench_points, 2),
-                    'bench_players': team2_bench_players
-                },
-                'winner': {
-                    'roster_id': matchup.winner_roster_id,
-                    'team_name': matchup.team1_name if matchup.winner_roster_id == matchup.team1_roster_id else matchup.team2_name,
-                    'bench_points': matchup.team1_bench_points if matchup.winner_roster_id == matchup.team1_roster_id else matchup.team2_bench_points,
-                    'bench_players': team1_bench_players if matchup.winner_roster_id == matchup.team1_roster_id else team2_bench_players
-                } if matchup.winner_roster_id else None,
-                'margin_of_victory': round(matchup.margin_of_victory, 2) if matchup.margin_of_victory else None,
-                'date_recorded': matchup.date_recorded.isoformat()
-            }
-            
-            matchups_data.append(matchup_data)
+        matchups_data = [
+            self._matchup_to_dict(i, matchup, results_by_key, bench_cache)
+            for i, matchup in enumerate(matchups, 1)
+        ]
         
         filepath = self.get_file_path('matchups.json')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(matchups_data, f, indent=2)
+        _dump(matchups_data, filepath)
         
-        print(f"🥊 Exported matchups data to {filepath}")
+        _report(f"🥊 Exported matchups data to {filepath}")
     
-    def _get_bench_players_for_matchup(self, roster_id: int, week: int, weekly_results: List[WeeklyBenchResult]) -> List[Dict]:
-        """Get bench players for a specific team and week from weekly results."""
-        # Find the weekly result for this team and week
-        for result in weekly_results:
-            if result.roster_id == roster_id and result.week == week:
-                bench_players = []
-                for player in result.bench_players:
-                    bench_players.append({
-                        'player_id': player.player_id,
-                        'name': player.player_name,
-                        'position': player.position,
-                        'team': player.team,
-                        'points': round(player.points, 2)
-                    })
-                return bench_players
-        return []
+    def _matchup_to_dict(self, matchup_number: int, matchup: BenchMatchup, results_by_key: Dict, bench_cache: Dict) -> Dict:
+        """Convert a matchup to the dashboard format."""
+        # Serialize each team's section once; the winner reuses it by reference
+        team1_data = {
+            'roster_id': matchup.team1_roster_id,
+            'team_name': matchup.team1_name,
+            'bench_points': round(matchup.team1_bench_points, 2),
+            'bench_players': self._get_bench_players_for_matchup(matchup.team1_roster_id, matchup.week, results_by_key, bench_cache)
+        }
+        team2_data = {
+            'roster_id': matchup.team2_roster_id,
+            'team_name': matchup.team2_name,
+            'bench_points': round(matchup.team2_bench_points, 2),
+            'bench_players': self._get_bench_players_for_matchup(matchup.team2_roster_id, matchup.week, results_by_key, bench_cache)
+        }
+        
+        winner_data = None
+        if matchup.winner_roster_id:
+            team1_won = matchup.winner_roster_id == matchup.team1_roster_id
+            winning_team = team1_data if team1_won else team2_data
+            winner_data = {
+                'roster_id': matchup.winner_roster_id,
+                'team_name': winning_team['team_name'],
+                'bench_points': matchup.team1_bench_points if team1_won else matchup.team2_bench_points,
+                'bench_players': winning_team['bench_players']
+            }
+        
+        return {
+            'id': matchup_number,
+            'week': matchup.week,
+            'matchup_id': matchup.matchup_id,
+            'team1': team1_data,
+            'team2': team2_data,
+            'winner': winner_data,
+            'margin_of_victory': round(matchup.margin_of_victory, 2) if matchup.margin_of_victory else None,
+            'date_recorded': matchup.date_recorded
+        }
+    
+    def _get_bench_players_for_matchup(self, roster_id: int, week: int, results_by_key: Dict, bench_cache: Dict) -> List[Dict]:
+        """Get bench players for a specific team and week, serialized once per (roster_id, week)."""
+        key = (roster_id, week)
+        if key not in bench_cache:
+            result = results_by_key.get(key)
+            bench_cache[key] = self._serialize_bench_players(result) if result else []
+        return bench_cache[key]
     
-    def export_analytics(self, weekly_results: List[WeeklyBenchResult], matchups: List[BenchMatchup], standings: List[SeasonBenchStandings]) -> None:
+    def _serialize_bench_players(self, result: WeeklyBenchResult) -> List[Dict]:
+        """Convert a result's bench players to JSON-serializable dicts."""
+        rnd = round  # local alias avoids a builtins lookup per player
+        return [
+            {
+                'player_id': player.player_id,
+                'name': player.player_name,
+                'position': player.position,
+                'team': player.team,
+                'points': rnd(player.points, 2)
+            }
+            for player in result.bench_players
+        ]
+    
+    def export_analytics(self, weekly_results: List[WeeklyBenchResult], matchups: List[BenchMatchup], standings: List[SeasonBenchStandings], standings_data: Optional[List[Dict]] = None) -> None:
         """Export analytics data to JSON."""
-        weeks = sorted(set(r.week for r in weekly_results))
-        total_teams = len(set(r.roster_id for r in weekly_results))
+        # Fold every aggregate into a single pass; per-week buckets are [sum, count, high, low]
+        teams_seen = set()
+        total_points = 0
+        highest, lowest = float('-inf'), float('inf')
+        per_week = defaultdict(lambda: [0, 0, float('-inf'), float('inf')])
+        
+        for r in weekly_results:
+            points = r.total_bench_points
+            teams_seen.add(r.roster_id)
+            total_points += points
+            if points > highest:
+                highest = points
+            if points < lowest:
+                lowest = points
+            
+            bucket = per_week[r.week]
+            bucket[0] += points
+            bucket[1] += 1
+            if points > bucket[2]:
+                bucket[2] = points
+            if points < bucket[3]:
+                bucket[3] = points
         
         # League stats
-        all_points = [r.total_bench_points for r in weekly_results]
+        result_count = len(weekly_results)
         league_stats = {
-            'total_weeks': len(weeks),
-            'total_teams': total_teams,
+            'total_weeks': len(per_week),
+            'total_teams': len(teams_seen),
             'total_matchups': len(matchups),
-            'average_weekly_points': round(sum(all_points) / len(all_points), 2) if all_points else 0,
-            'highest_weekly_score': round(max(all_points), 2) if all_points else 0,
-            'lowest_weekly_score': round(min(all_points), 2) if all_points else 0,
-            'total_points_scored': round(sum(all_points), 2)
+            'average_weekly_points': round(total_points / result_count, 2) if result_count else 0,
+            'highest_weekly_score': round(highest, 2) if result_count else 0,
+            'lowest_weekly_score': round(lowest, 2) if result_count else 0,
+            'total_points_scored': round(total_points, 2)
         }
         
         # Weekly trends
-        weekly_trends = []
-        for week in weeks:
-            week_results = [r for r in weekly_results if r.week == week]
-            week_points = [r.total_bench_points for r in week_results]
-            
-            if week_points:
-                weekly_trends.append({
-                    'week': week,
-                    'average_points': round(sum(week_points) / len(week_points), 2),
-                    'highest_score': round(max(week_points), 2),
-                    'lowest_score': round(min(week_points), 2),
-                    'total_points': round(sum(week_points), 2),
-                    'teams_played': len(week_results)
-                })
+        weekly_trends = [
+            {
+                'week': week,
+                'average_points': round(week_total / week_count, 2),
+                'highest_score': round(week_high, 2),
+                'lowest_score': round(week_low, 2),
+                'total_points': round(week_total, 2),
+                'teams_played': week_count
+            }
+            for week, (week_total, week_count, week_high, week_low) in sorted(per_week.items())
+        ]
         
         # Team performance (convert standings to match expected format)
-        team_performance = []
-        for standing in standings:
-            team_performance.append({
-                'team': {
-                    'roster_id': standing.roster_id,
-                    'team_name': standing.team_name,
-                    'owner_id': standing.owner_id
-                },
-                'total_points': round(standing.total_bench_points, 2),
-                'average_points': round(standing.average_bench_points, 2),
-                'weeks_played': standing.total_weeks,
-                'best_week': round(standing.best_week_points, 2),
-                'worst_week': round(standing.worst_week_points, 2),
-                'wins': standing.wins,
-                'losses': standing.losses,
-                'win_percentage': round(standing.win_percentage, 3)
-            })
+        if standings_data is None:
+            standings_data = self._standings_to_dicts(standings)
         
         analytics_data = {
             'league_stats': league_stats,
             'weekly_trends': weekly_trends,
-            'team_performance': team_performance
+            'team_performance': standings_data
         }
         
         filepath = self.get_file_path('analytics.json')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(analytics_data, f, indent=2)
+        _dump(analytics_data, filepath)
         
-        print(f"📊 Exported analytics data to {filepath}")
+        _report(f"📊 Exported analytics data to {filepath}")
     
     def export_teams(self, teams: Dict[int, Dict]) -> None:
         """Export teams data to JSON."""
         teams_array = list(teams.values())
         
         filepath = self.get_file_path('teams.json')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(teams_array, f, indent=2)
+        _dump(teams_array, filepath)
         
-        print(f"👥 Exported teams data to {filepath}")
+        _report(f"👥 Exported teams data to {filepath}")
     
     def export_weekly_results(self, weekly_results: List[WeeklyBenchResult]) -> None:
         """Export weekly results data to JSON."""
-        results_data = []
+        filepath = self.get_file_path('weekly-results.json')
+        _dump_rows(self._weekly_result_rows(weekly_results), filepath)
         
+        _report(f"📅 Exported weekly results data to {filepath}")
+    
+    def _weekly_result_rows(self, weekly_results: List[WeeklyBenchResult]) -> Iterator[Dict]:
+        """Yield one dashboard row per weekly result."""
         for result in weekly_results:
-            # Convert bench players to JSON-serializable format
-            bench_players = []
-            for player in result.bench_players:
-                bench_players.append({
-                    'player_id': player.player_id,
-                    'name': player.player_name,
-                    'position': player.position,
-                    'team': player.team,
-                    'points': round(player.points, 2)
-                })
-            
-            results_data.append({
+            yield {
                 'week': result.week,
                 'roster_id': result.roster_id,
                 'team_name': result.team_name,
                 'total_bench_points': round(result.total_bench_points, 2),
                 'bench_player_count': result.bench_player_count,
-                'date_recorded': result.date_recorded.isoformat(),
-                'bench_players_json': json.dumps(bench_players)
-            })
-        
-        filepath = self.get_file_path('weekly-results.json')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results_data, f, indent=2)
-        
-        print(f"📅 Exported weekly results data to {filepath}")
+                'date_recorded': result.date_recorded,
+                'bench_players': self._serialize_bench_players(result)
+            }
 
 # Convenience function
-def export_dashboard_data(weekly_results: List[WeeklyBenchResult], matchups: List[BenchMatchup], standings: List[SeasonBenchStandings], data_dir: str = None) -> None:
+def export_dashboard_data(weekly_results: List[WeeklyBenchResult], matchups: List[BenchMatchup], standings: List[SeasonBenchStandings], data_dir: str = None, force: bool = False) -> None:
     """Export all data for dashboard consumption."""
     if data_dir is None:
         data_dir = config.data_dir
     
     exporter = JSONExporter(data_dir)
-    exporter.export_all_data(weekly_results, matchups, standings)
+    exporter.export_all_data(weekly_results, matchups, standings, force)
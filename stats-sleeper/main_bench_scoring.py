@@ -3,6 +3,7 @@
 Main entry point for the Beer League bench scoring system.
 """
 import argparse
+import os
 import sys
 from typing import Optional
 from datetime import datetime
@@ -83,6 +84,11 @@ Examples:
         action='store_true', 
         help='Generate reports from existing data without processing new weeks'
     )
+    parser.add_argument(
+        '--force-export', 
+        action='store_true', 
+        help='Rewrite dashboard JSON even if the input data is unchanged'
+    )
     
     # Display options
     parser.add_argument(
@@ -221,20 +227,32 @@ def determine_weeks_to_process(args, scorer: BenchScorer) -> list:
         
         return list(range(args.start_week, end_week + 1))
 
+def _latest_data_file(data_dir: str, prefix: str) -> Optional[str]:
+    """Find the most recently modified CSV in data_dir whose name starts with prefix."""
+    latest_path = None
+    latest_mtime = -1.0
+    
+    # scandir returns cached stat data, so this is one directory pass rather than glob + stat per file
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.name.endswith('.csv'):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
+                    latest_path = entry.path
+    
+    return latest_path
+
 def generate_reports_only(data_manager: BenchDataManager, reporter: BenchReporter, args) -> int:
     """Generate reports from existing data."""
     try:
-        # Look for most recent data files
-        import os
-        import glob
-        
         data_dir = args.output_dir
         
         # Find most recent results and matchups files
-        results_files = glob.glob(os.path.join(data_dir, "weekly_results_*.csv"))
-        matchups_files = glob.glob(os.path.join(data_dir, "weekly_matchups_*.csv"))
+        latest_results_file = _latest_data_file(data_dir, "weekly_results_")
+        latest_matchups_file = _latest_data_file(data_dir, "weekly_matchups_")
         
-        if not results_files and not matchups_files:
+        if not latest_results_file and not latest_matchups_file:
             print("No existing data files found")
             return 1
         
@@ -242,14 +260,12 @@ def generate_reports_only(data_manager: BenchDataManager, reporter: BenchReporte
         results = []
         matchups = []
         
-        if results_files:
-            latest_results_file = max(results_files, key=os.path.getctime)
+        if latest_results_file:
             filename = os.path.basename(latest_results_file)
             results = data_manager.load_historical_data(filename)
             print(f"Loaded {len(results)} results from {filename}")
         
-        if matchups_files:
-            latest_matchups_file = max(matchups_files, key=os.path.getctime)
+        if latest_matchups_file:
             filename = os.path.basename(latest_matchups_file)
             matchups = data_manager.load_matchup_history(filename)
             print(f"Loaded {len(matchups)} matchups from {filename}")
@@ -285,7 +301,7 @@ def generate_reports(results, matchups, data_manager: BenchDataManager, reporter
         
         # Export JSON data for dashboard (replaces CSV export)
         from json_exporter import export_dashboard_data
-        export_dashboard_data(results, matchups, standings, data_manager.data_dir)
+        export_dashboard_data(results, matchups, standings, data_manager.data_dir, force=args.force_export)
         
         # Generate HTML report if requested
         if args.html:
@@ -294,7 +310,7 @@ def generate_reports(results, matchups, data_manager: BenchDataManager, reporter
     
     # Generate weekly reports for recent weeks
     if results:
-        recent_weeks = sorted(set(r.week for r in results))[-3:]  # Last 3 weeks
+        recent_weeks = sorted({r.week for r in results})[-3:]  # Last 3 weeks
         
         for week in recent_weeks:
             week_results = [r for r in results if r.week == week]
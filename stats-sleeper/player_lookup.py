@@ -4,11 +4,21 @@ Handles fetching and caching player data from Sleeper API.
 """
 import json
 import os
+import sys
 import time
 from typing import Dict, Optional, NamedTuple
 import requests
 from config import config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality field; Sleeper leaves some positions null."""
+    return sys.intern(value) if value is not None else None
+
 class PlayerInfo(NamedTuple):
     player_id: str
     name: str
@@ -33,8 +43,7 @@ class PlayerLookup:
             try:
                 cached_players = self.load_cached_players()
                 if cached_players:
-                    self.players_cache = cached_players
-                    self.cache_loaded = True
+                    self._set_players(cached_players)
                     print(f"Loaded {len(cached_players)} players from cache")
                     return cached_players
             except Exception as e:
@@ -49,30 +58,36 @@ class PlayerLookup:
             )
             response.raise_for_status()
             
-            raw_players = response.json()
+            # The payload is several MB; orjson parses it well ahead of stdlib json
+            raw_players = orjson.loads(response.content) if orjson is not None else response.json()
             players_dict = {}
             
             for player_id, player_data in raw_players.items():
-                if player_data and isinstance(player_data, dict):
-                    # Extract player information
-                    name = f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip()
-                    if not name:
-                        name = player_data.get('full_name', f"Player_{player_id}")
-                    
-                    position = player_data.get('position', 'UNK')
-                    team = player_data.get('team', 'FA')
-                    
-                    # Only include players with valid data
-                    if name and name != f"Player_{player_id}":
-                        players_dict[player_id] = PlayerInfo(
-                            player_id=player_id,
-                            name=name,
-                            position=position,
-                            team=team or 'FA'
-                        )
-            
-            self.players_cache = players_dict
-            self.cache_loaded = True
+                if not player_data or not isinstance(player_data, dict):
+                    continue
+                
+                # Extract player information
+                first = player_data.get('first_name') or ''
+                last = player_data.get('last_name') or ''
+                if first and last:
+                    name = first + ' ' + last
+                else:
+                    name = (first or last).strip() or player_data.get('full_name')
+                
+                # Only include players with valid data
+                if not name or name == 'Player_' + player_id:
+                    continue
+                
+                # Positions and teams repeat across thousands of players
+                player_id = sys.intern(player_id)
+                players_dict[player_id] = PlayerInfo(
+                    player_id,
+                    name,
+                    _intern(player_data.get('position', 'UNK')),
+                    sys.intern(player_data.get('team') or 'FA')
+                )
+            
+            self._set_players(players_dict)
             
             # Cache the data
             if config.cache_players:
@@ -88,6 +103,14 @@ class PlayerLookup:
             print(f"Unexpected error fetching players: {e}")
             return {}
     
+    def _set_players(self, players_dict: Dict[str, PlayerInfo]) -> None:
+        """Install loaded player data and switch lookups to the fast path."""
+        self.players_cache = players_dict
+        self.cache_loaded = True
+        # The dict is read-only once loaded, so later lookups can go
+        # straight to dict.get without the load check
+        self.lookup_player_info = players_dict.get
+    
     def lookup_player_info(self, player_id: str) -> Optional[PlayerInfo]:
         """Get player details by ID."""
         if not self.cache_loaded:
@@ -98,25 +121,27 @@ class PlayerLookup:
     def cache_player_data(self, players_dict: Dict[str, PlayerInfo]) -> None:
         """Cache player data locally."""
         try:
-            # Convert PlayerInfo objects to dictionaries for JSON serialization
+            # Store one list per PlayerInfo field rather than a dict per player
+            players = players_dict.values()
             cache_data = {
                 'timestamp': time.time(),
-                'players': {
-                    player_id: {
-                        'player_id': info.player_id,
-                        'name': info.name,
-                        'position': info.position,
-                        'team': info.team
-                    }
-                    for player_id, info in players_dict.items()
-                }
+                'ids': [info.player_id for info in players],
+                'names': [info.name for info in players],
+                'positions': [info.position for info in players],
+                'teams': [info.team for info in players]
             }
             
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
             
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            # Compact output; the cache is machine-read only
+            if orjson is not None:
+                data = orjson.dumps(cache_data)
+            else:
+                data = json.dumps(cache_data, separators=(',', ':')).encode('utf-8')
+            
+            with open(self.cache_file, 'wb') as f:
+                f.write(data)
             
             print(f"Cached {len(players_dict)} players to {self.cache_file}")
             
@@ -126,8 +151,17 @@ class PlayerLookup:
     def load_cached_players(self) -> Dict[str, PlayerInfo]:
         """Load cached player data."""
         try:
-            with open(self.cache_file, 'r') as f:
-                cache_data = json.load(f)
+            # The file can't be fresher than its mtime, so an old file is rejected
+            # without parsing it. A recent mtime proves nothing (a checkout or copy
+            # resets it); the embedded timestamp decides in that case.
+            if time.time() - os.stat(self.cache_file).st_mtime > 86400:  # 24 hours in seconds
+                print("Player cache is older than 24 hours, will refresh from API")
+                return {}
+            
+            with open(self.cache_file, 'rb') as f:
+                raw = f.read()
+            # orjson reads both the compact format and older indented caches
+            cache_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             # Check if cache is recent (less than 24 hours old)
             cache_age = time.time() - cache_data.get('timestamp', 0)
@@ -135,19 +169,31 @@ class PlayerLookup:
                 print("Player cache is older than 24 hours, will refresh from API")
                 return {}
             
-            # Convert dictionary data back to PlayerInfo objects
+            # Convert the column lists back to PlayerInfo objects
+            if 'ids' in cache_data:
+                ids = list(map(sys.intern, cache_data['ids']))
+                rows = zip(
+                    ids,
+                    cache_data['names'],
+                    map(_intern, cache_data['positions']),
+                    map(_intern, cache_data['teams'])
+                )
+                return dict(zip(ids, map(PlayerInfo._make, rows)))
+            
+            # Older caches stored a dict per player
             players_dict = {}
             for player_id, player_data in cache_data.get('players', {}).items():
+                player_id = sys.intern(player_id)
                 players_dict[player_id] = PlayerInfo(
-                    player_id=player_data['player_id'],
-                    name=player_data['name'],
-                    position=player_data['position'],
-                    team=player_data['team']
+                    player_id,
+                    player_data['name'],
+                    _intern(player_data['position']),
+                    _intern(player_data['team'])
                 )
             
             return players_dict
             
-        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+        except (FileNotFoundError, ValueError, KeyError) as e:
             print(f"Error loading cached players: {e}")
             return {}
     
@@ -155,6 +201,7 @@ class PlayerLookup:
         """Force refresh of player cache."""
         self.cache_loaded = False
         self.players_cache = {}
+        self.__dict__.pop('lookup_player_info', None)
         
         # Remove existing cache file
         if os.path.exists(self.cache_file):
@@ -3,9 +3,32 @@
 Test script to verify IR player filtering is working correctly.
 """
 
+import sys
 from bench_scorer import BenchScorer
 from config import config
-import json
+from concurrent.futures import ThreadPoolExecutor
+
+def print_week_results(results):
+    """Print each team's bench breakdown for one week."""
+    # Collect the lines and write them in one go rather than one print per field
+    buf = []
+    for result in results:
+        buf.append(f"Team: {result.team_name} (Roster {result.roster_id})")
+        buf.append(f"  Bench Points: {result.total_bench_points}")
+        buf.append(f"  Bench Players: {result.bench_player_count}")
+        
+        # Show individual bench players
+        if result.bench_players:
+            buf.append("  Players:")
+            for player in result.bench_players:
+                buf.append(f"    {player.player_name} ({player.position}): {player.points} pts")
+        else:
+            buf.append("  No bench players found")
+        buf.append("")
+    
+    if buf:
+        sys.stdout.write('\n'.join(buf) + '\n')
+    sys.stdout.flush()
 
 def test_ir_filtering():
     """Test that IR players are properly excluded from bench scoring."""
@@ -15,42 +38,18 @@ def test_ir_filtering():
     
     # Initialize bench scorer
     scorer = BenchScorer(config.league_id)
+    scorer.prefetch_players()
     
-    # Test week 1 (should have some bench points)
-    print("\nTesting Week 1:")
-    week1_results = scorer.process_week_bench_scores(1)
-    
-    for result in week1_results:
-        print(f"Team: {result.team_name} (Roster {result.roster_id})")
-        print(f"  Bench Points: {result.total_bench_points}")
-        print(f"  Bench Players: {result.bench_player_count}")
-        
-        # Show individual bench players
-        if result.bench_players:
-            print("  Players:")
-            for player in result.bench_players:
-                print(f"    {player.player_name} ({player.position}): {player.points} pts")
-        else:
-            print("  No bench players found")
-        print()
-    
-    # Test week 2 (current week with low scores)
-    print("\nTesting Week 2:")
-    week2_results = scorer.process_week_bench_scores(2)
+    # Week 1 should have some bench points; week 2 is the current week with low scores.
+    # Each week is independent Sleeper I/O, so fetch them concurrently and print in order.
+    weeks = [1, 2]
+    with ThreadPoolExecutor(max_workers=min(8, len(weeks))) as executor:
+        futures = {week: executor.submit(scorer.process_week_bench_scores, week) for week in weeks}
+        results = {week: futures[week].result() for week in weeks}
     
-    for result in week2_results:
-        print(f"Team: {result.team_name} (Roster {result.roster_id})")
-        print(f"  Bench Points: {result.total_bench_points}")
-        print(f"  Bench Players: {result.bench_player_count}")
-        
-        # Show individual bench players
-        if result.bench_players:
-            print("  Players:")
-            for player in result.bench_players:
-                print(f"    {player.player_name} ({player.position}): {player.points} pts")
-        else:
-            print("  No bench players found")
-        print()
+    for week in weeks:
+        print(f"\nTesting Week {week}:")
+        print_week_results(results[week])
 
 def debug_specific_roster():
     """Debug a specific roster to see IR vs bench breakdown."""
@@ -59,42 +58,48 @@ def debug_specific_roster():
     print("=" * 50)
     
     scorer = BenchScorer(config.league_id)
+    players_map = scorer.prefetch_players()
     
     # Get roster data
-    rosters = scorer.league.get_rosters()
-    roster_1 = None
-    for roster in rosters:
-        if roster.get('roster_id') == 1:
-            roster_1 = roster
-            break
+    roster_1 = scorer.get_rosters_by_id().get(1)
     
     if roster_1:
-        print("Roster 1 breakdown:")
-        print(f"All players: {len(roster_1.get('players', []))}")
-        print(f"Starters: {len(roster_1.get('starters', []))}")
-        print(f"Reserve (IR): {len(roster_1.get('reserve', []))}")
-        
-        players = roster_1.get('players', [])
-        starters = roster_1.get('starters', [])
-        reserve = roster_1.get('reserve', [])
+        players = roster_1.get('players') or []
+        starters = roster_1.get('starters') or []
+        reserve = roster_1.get('reserve') or []
         
-        print(f"\nAll players: {players}")
-        print(f"Starters: {starters}")
-        print(f"Reserve (IR): {reserve}")
+        # Hash each roster list once and reuse the sets below
+        players_set, starters_set, reserve_set = map(frozenset, (players, starters, reserve))
         
         # Calculate bench using old method (includes IR)
-        old_bench = list(set(players) - set(starters))
-        print(f"\nOld method (includes IR): {len(old_bench)} bench players")
-        print(f"Old bench players: {old_bench}")
+        old_bench = players_set - starters_set
         
         # Calculate bench using new method (excludes IR)
-        new_bench = scorer.identify_bench_players(players, starters, reserve)
-        print(f"\nNew method (excludes IR): {len(new_bench)} bench players")
-        print(f"New bench players: {new_bench}")
+        new_bench = scorer.identify_bench_players_sets(players_set, starters_set, reserve_set)
         
         # Show the difference
-        ir_players_in_old = set(old_bench) & set(reserve)
-        print(f"\nIR players that were incorrectly included in old method: {list(ir_players_in_old)}")
+        ir_players_in_old = old_bench & reserve_set
+        
+        buf = [
+            "Roster 1 breakdown:",
+            f"All players: {len(players)}",
+            f"Starters: {len(starters)}",
+            f"Reserve (IR): {len(reserve)}",
+            f"\nAll players: {players}",
+            f"Starters: {starters}",
+            f"Reserve (IR): {reserve}",
+            f"\nOld method (includes IR): {len(old_bench)} bench players",
+            f"Old bench players: {list(old_bench)}",
+            f"\nNew method (excludes IR): {len(new_bench)} bench players",
+            f"New bench players: {list(new_bench)}",
+        ]
+        for player_id in new_bench:
+            info = players_map.get(player_id)
+            buf.append(f"  {player_id}: {info.name} ({info.position})" if info else f"  {player_id}: unknown")
+        buf.append(f"\nIR players that were incorrectly included in old method: {list(ir_players_in_old)}")
+        
+        sys.stdout.write('\n'.join(buf) + '\n')
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     test_ir_filtering()
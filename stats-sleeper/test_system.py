@@ -2,11 +2,21 @@
 """
 Test script to validate the bench scoring system components.
 """
+import functools
+import importlib.metadata
+import importlib.util
+import re
 import sys
 import os
 from typing import List, Dict, Any
 import traceback
 
+@functools.lru_cache(maxsize=None)
+def get_scorer(league_id: str):
+    """Shared BenchScorer per league so tests don't repeat the league data fetch."""
+    from bench_scorer import BenchScorer
+    return BenchScorer(league_id)
+
 def test_imports():
     """Test that all modules can be imported."""
     print("Testing imports...")
@@ -200,17 +210,16 @@ def test_bench_scorer_init():
     print("\nTesting BenchScorer initialization...")
     
     try:
-        from bench_scorer import BenchScorer
         from config import config
         
         # Test with default league ID
         if config.league_id and config.league_id != "your_league_id_here":
-            scorer = BenchScorer(config.league_id)
+            scorer = get_scorer(config.league_id)
             print("✓ BenchScorer initialized with config league ID")
             return True
         else:
             # Test with dummy league ID
-            scorer = BenchScorer("123456789")
+            scorer = get_scorer("123456789")
             print("✓ BenchScorer initialized with test league ID")
             return True
             
@@ -303,6 +312,10 @@ def test_main_script():
         print(f"✗ Main script test failed: {e}")
         return False
 
+def _normalize_distribution_name(name: str) -> str:
+    """Normalize a distribution name per PEP 503 so e.g. Jinja2 and jinja2 compare equal."""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
 def test_dependencies():
     """Test that all required dependencies are available."""
     print("\nTesting dependencies...")
@@ -316,18 +329,25 @@ def test_dependencies():
         'pandas'
     ]
     
+    # Distribution names where they differ from the entry above, and the module
+    # to look for if the distribution metadata is missing (e.g. vendored installs)
+    distribution_names = {'sleeper_wrapper': 'sleeper-api-wrapper'}
+    module_names = {'python-dotenv': 'dotenv'}
+    
+    # One scan of installed distribution metadata, without importing any package
+    installed = {
+        _normalize_distribution_name(dist.metadata['Name'])
+        for dist in importlib.metadata.distributions()
+        if dist.metadata['Name']
+    }
+    
     missing_packages = []
     
     for package in required_packages:
-        try:
-            if package == 'sleeper_wrapper':
-                import sleeper_wrapper
-            elif package == 'python-dotenv':
-                import dotenv
-            else:
-                __import__(package)
+        dist_name = _normalize_distribution_name(distribution_names.get(package, package))
+        if dist_name in installed or importlib.util.find_spec(module_names.get(package, package)):
             print(f"✓ {package} available")
-        except ImportError:
+        else:
             print(f"✗ {package} missing")
             missing_packages.append(package)
     
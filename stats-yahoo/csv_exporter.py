@@ -6,11 +6,24 @@ This module handles the export of extracted fantasy data to CSV format.
 """
 
 import pandas as pd
+import csv
+import gzip
 import os
+from collections import Counter
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Supported output formats; output_format arguments are checked against these keys
+OUTPUT_SUFFIXES = {'csv': '.csv', 'csv.gz': '.csv.gz', 'parquet': '.parquet'}
+
+# pandas 3 defers copies under Copy-on-Write and deprecates the copy keyword;
+# older versions need copy=False to skip the block copy on reindex
+_REINDEX_NO_COPY = {'copy': False} if int(pd.__version__.split('.')[0]) < 3 else {}
+
 class CSVExporter:
     """Export fantasy data to CSV files."""
     
@@ -20,134 +33,211 @@ class CSVExporter:
         self.output_dir.mkdir(exist_ok=True)
         
         # Set up logging
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
     
-    def export_final_rankings(self, rankings_data: List[Dict], filename: str = "final_rankings_by_season.csv"):
+    def export_final_rankings(self, rankings_data: List[Dict], filename: str = "final_rankings_by_season.csv",
+                              use_pandas: bool = False, output_format: str = 'csv'):
         """Export final rankings data to CSV."""
         try:
             if not rankings_data:
                 self.logger.warning("No rankings data to export")
                 return False
             
-            # Create DataFrame
-            df = pd.DataFrame(rankings_data)
-            
-            # Sort by season and rank
-            df = df.sort_values(['season', 'rank'])
-            
             # Reorder columns for better readability
             column_order = [
                 'season', 'rank', 'team_name', 'wins', 'losses', 'ties',
                 'points_for', 'points_against', 'team_key', 'extracted_date'
             ]
             
-            # Only include columns that exist in the data
-            available_columns = [col for col in column_order if col in df.columns]
-            df = df[available_columns]
+            # Export, sorted by season and rank
+            output_path = self._output_path(filename, output_format)
+            count = self._write(rankings_data, column_order, ('season', 'rank'), output_path, use_pandas, output_format)
             
-            # Export to CSV
-            output_path = self.output_dir / filename
-            df.to_csv(output_path, index=False)
-            
-            self.logger.info(f"Exported {len(df)} ranking records to {output_path}")
+            self.logger.info(f"Exported {count} ranking records to {output_path}")
             return True
             
         except Exception as e:
             self.logger.error(f"Error exporting rankings data: {e}")
             return False
     
-    def export_highest_scores(self, scores_data: List[Dict], filename: str = "highest_scores_by_season.csv"):
+    def export_highest_scores(self, scores_data: List[Dict], filename: str = "highest_scores_by_season.csv",
+                              use_pandas: bool = False, output_format: str = 'csv'):
         """Export highest scores data to CSV."""
         try:
             if not scores_data:
                 self.logger.warning("No highest scores data to export")
                 return False
             
-            # Create DataFrame
-            df = pd.DataFrame(scores_data)
-            
-            # Sort by season and week
-            df = df.sort_values(['season', 'week'])
-            
             # Reorder columns for better readability
             column_order = [
                 'season', 'week', 'team_name', 'points', 'team_key', 'extracted_date'
             ]
             
-            # Only include columns that exist in the data
-            available_columns = [col for col in column_order if col in df.columns]
-            df = df[available_columns]
-            
-            # Round points to 2 decimal places
-            if 'points' in df.columns:
-                df['points'] = df['points'].round(2)
+            # Export, sorted by season and week with points rounded to 2 decimal places
+            output_path = self._output_path(filename, output_format)
+            count = self._write(scores_data, column_order, ('season', 'week'), output_path, use_pandas, output_format)
             
-            # Export to CSV
-            output_path = self.output_dir / filename
-            df.to_csv(output_path, index=False)
-            
-            self.logger.info(f"Exported {len(df)} highest score records to {output_path}")
+            self.logger.info(f"Exported {count} highest score records to {output_path}")
             return True
             
         except Exception as e:
             self.logger.error(f"Error exporting highest scores data: {e}")
             return False
     
-    def export_lowest_scores(self, scores_data: List[Dict], filename: str = "lowest_scores_by_season.csv"):
+    def export_lowest_scores(self, scores_data: List[Dict], filename: str = "lowest_scores_by_season.csv",
+                             use_pandas: bool = False, output_format: str = 'csv'):
         """Export lowest scores data to CSV."""
         try:
             if not scores_data:
                 self.logger.warning("No lowest scores data to export")
                 return False
             
-            # Create DataFrame
-            df = pd.DataFrame(scores_data)
-            
-            # Sort by season and week
-            df = df.sort_values(['season', 'week'])
-            
             # Reorder columns for better readability
             column_order = [
                 'season', 'week', 'team_name', 'points', 'team_key', 'extracted_date'
             ]
             
-            # Only include columns that exist in the data
-            available_columns = [col for col in column_order if col in df.columns]
-            df = df[available_columns]
+            # Export, sorted by season and week with points rounded to 2 decimal places
+            output_path = self._output_path(filename, output_format)
+            count = self._write(scores_data, column_order, ('season', 'week'), output_path, use_pandas, output_format)
             
-            # Round points to 2 decimal places
-            if 'points' in df.columns:
-                df['points'] = df['points'].round(2)
-            
-            # Export to CSV
-            output_path = self.output_dir / filename
-            df.to_csv(output_path, index=False)
-            
-            self.logger.info(f"Exported {len(df)} lowest score records to {output_path}")
+            self.logger.info(f"Exported {count} lowest score records to {output_path}")
             return True
             
         except Exception as e:
             self.logger.error(f"Error exporting lowest scores data: {e}")
             return False
     
+    def _output_path(self, filename: str, output_format: str) -> Path:
+        """Resolve the output file, swapping the .csv suffix for the chosen format."""
+        if output_format not in OUTPUT_SUFFIXES:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        return (self.output_dir / filename).with_suffix(OUTPUT_SUFFIXES[output_format])
+    
+    @staticmethod
+    def _open_text(output_path: Path):
+        """Open a CSV output for writing, gzip-compressed when the path ends in .gz."""
+        if output_path.suffix == '.gz':
+            return gzip.open(output_path, 'wt', newline='', encoding='utf-8')
+        return open(output_path, 'w', newline='', encoding='utf-8')
+    
+    def _write(self, rows: List[Dict], column_order: List[str], sort_keys: Tuple[str, ...],
+               output_path: Path, use_pandas: bool, output_format: str) -> int:
+        """Write data with the cheapest writer that supports the requested format."""
+        # Parquet always goes through pandas; CSV uses the stdlib writers unless asked otherwise
+        if use_pandas or output_format == 'parquet':
+            return self._write_dataframe(rows, column_order, sort_keys, output_path)
+        return self._write_csv(rows, column_order, sort_keys, output_path)
+    
+    def _write_csv(self, rows: List[Dict], column_order: List[str], sort_keys: Tuple[str, ...],
+                   output_path: Path) -> int:
+        """Sort rows and stream them to CSV with the stdlib writer, skipping a DataFrame build."""
+        # Only include columns that exist in the data
+        present = set().union(*rows)
+        columns = [col for col in column_order if col in present]
+        
+        rows = sorted(rows, key=itemgetter(*sort_keys))
+        float_columns = self._float_columns(rows, columns)
+        
+        with self._open_text(output_path) as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore', lineterminator=os.linesep)
+            writer.writeheader()
+            if float_columns or 'points' in present:
+                writer.writerows(self._format_row(row, float_columns) for row in rows)
+            else:
+                writer.writerows(rows)
+        
+        return len(rows)
+    
+    @staticmethod
+    def _float_columns(rows: List[Dict], columns: List[str]) -> List[str]:
+        """Columns pandas would store as float64, so to_csv writes their ints as e.g. 100.0.
+        
+        That is a column holding only numbers and gaps (None or a missing key, which
+        pandas reads as NaN), with at least one number and at least one float or gap.
+        """
+        float_columns = []
+        for col in columns:
+            has_number = has_float_or_gap = False
+            for row in rows:
+                value = row.get(col)
+                if value is None:
+                    has_float_or_gap = True
+                elif isinstance(value, float):
+                    has_number = has_float_or_gap = True
+                elif isinstance(value, int) and not isinstance(value, bool):
+                    has_number = True
+                else:
+                    break  # mixed with text or bools: pandas keeps objects as they are
+            else:
+                if has_number and has_float_or_gap:
+                    float_columns.append(col)
+        return float_columns
+    
+    @staticmethod
+    def _format_row(row: Dict, float_columns: List[str]) -> Dict:
+        """Format a row's values the way DataFrame.to_csv would; gaps stay empty cells."""
+        row = dict(row)
+        for col in float_columns:
+            if row.get(col) is not None:
+                row[col] = float(row[col])
+        # Round points to 2 decimal places
+        if row.get('points') is not None:
+            row['points'] = round(row['points'], 2)
+        return row
+    
+    @staticmethod
+    def _season_counts(data: List[Dict]) -> Counter:
+        """Count rows per season."""
+        return Counter(item['season'] for item in data or ())
+    
+    @staticmethod
+    def _reorder(df: pd.DataFrame, column_order: List[str]) -> pd.DataFrame:
+        """Select and order the columns that exist in the data in a single reindex."""
+        return df.reindex(columns=[col for col in column_order if col in df.columns], **_REINDEX_NO_COPY)
+    
+    def _write_dataframe(self, rows: List[Dict], column_order: List[str], sort_keys: Tuple[str, ...],
+                         output_path: Path) -> int:
+        """Sort rows and write them to CSV or Parquet through pandas."""
+        df = pd.DataFrame(rows)
+        df = df.sort_values(list(sort_keys))
+        
+        df = self._reorder(df, column_order)
+        
+        # Round points to 2 decimal places
+        if 'points' in df.columns:
+            df['points'] = df['points'].round(2)
+        
+        if output_path.suffix == '.parquet':
+            df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+        else:
+            # to_csv infers gzip compression from a .gz suffix
+            df.to_csv(output_path, index=False)
+        return len(df)
+    
     def export_all_data(self, rankings_data: List[Dict], highest_scores_data: List[Dict], 
-                       lowest_scores_data: List[Dict]) -> bool:
+                       lowest_scores_data: List[Dict], output_format: str = 'csv') -> bool:
         """Export all data types to their respective CSV files."""
         try:
+            if output_format not in OUTPUT_SUFFIXES:
+                # Fail once up front rather than once per data type
+                self.logger.error(f"Unsupported output format: {output_format}")
+                return False
+            
             self.logger.info("Starting CSV export for all data...")
             
             success_count = 0
             
             # Export rankings
-            if self.export_final_rankings(rankings_data):
+            if self.export_final_rankings(rankings_data, output_format=output_format):
                 success_count += 1
             
             # Export highest scores
-            if self.export_highest_scores(highest_scores_data):
+            if self.export_highest_scores(highest_scores_data, output_format=output_format):
                 success_count += 1
             
             # Export lowest scores
-            if self.export_lowest_scores(lowest_scores_data):
+            if self.export_lowest_scores(lowest_scores_data, output_format=output_format):
                 success_count += 1
             
             self.logger.info(f"Successfully exported {success_count}/3 data types")
@@ -163,18 +253,18 @@ class CSVExporter:
         try:
             self.logger.info("Creating extraction summary report...")
             
-            # Analyze the data
-            seasons_in_rankings = set(item['season'] for item in rankings_data) if rankings_data else set()
-            seasons_in_highest = set(item['season'] for item in highest_scores_data) if highest_scores_data else set()
-            seasons_in_lowest = set(item['season'] for item in lowest_scores_data) if lowest_scores_data else set()
+            # Count rows per season in one pass over each data set
+            rankings_counts = self._season_counts(rankings_data)
+            highest_counts = self._season_counts(highest_scores_data)
+            lowest_counts = self._season_counts(lowest_scores_data)
             
-            all_seasons = seasons_in_rankings.union(seasons_in_highest).union(seasons_in_lowest)
+            all_seasons = rankings_counts.keys() | highest_counts.keys() | lowest_counts.keys()
             
             summary_data = []
             for season in sorted(all_seasons):
-                rankings_count = len([item for item in rankings_data if item['season'] == season])
-                highest_count = len([item for item in highest_scores_data if item['season'] == season])
-                lowest_count = len([item for item in lowest_scores_data if item['season'] == season])
+                rankings_count = rankings_counts[season]
+                highest_count = highest_counts[season]
+                lowest_count = lowest_counts[season]
                 
                 summary_data.append({
                     'season': season,
@@ -199,7 +289,10 @@ class CSVExporter:
     def list_exported_files(self):
         """List all CSV files in the output directory."""
         try:
-            csv_files = list(self.output_dir.glob("*.csv"))
+            csv_files = [
+                path for pattern in ("*.csv", "*.csv.gz", "*.parquet")
+                for path in self.output_dir.glob(pattern)
+            ]
             
             if csv_files:
                 self.logger.info("Exported CSV files:")
@@ -12,14 +12,19 @@ except ImportError:
     print("Error: yahoofantasy package not installed. Run: pip install -r requirements.txt")
     exit(1)
 
+from yahoo_cache import cached_get_leagues, get_ctx
+
 # Load environment variables
 load_dotenv()
 
+# Casefolded once; casefold also handles mixed-case Unicode names that lower() misses
+TARGET_CF = 'beer league'.casefold()
+
 def debug_2018():
     """Check if 2018 Beer League exists."""
     try:
         print("🔍 Checking for Beer League in 2018...")
-        ctx = Context()
+        ctx = get_ctx()
         
         # Check years around 2018
         for year in [2018, 2017, 2016, 2015]:
@@ -28,7 +33,7 @@ def debug_2018():
             print(f"{'='*30}")
             
             try:
-                leagues = ctx.get_leagues('nfl', year)
+                leagues = cached_get_leagues(ctx, 'nfl', year)
                 print(f"Found {len(leagues)} leagues for {year}")
                 
                 # Look for Beer League
@@ -39,7 +44,7 @@ def debug_2018():
                     
                     print(f"  {i}. '{league_name}' ({league_key})")
                     
-                    if 'beer league' in league_name.lower():
+                    if TARGET_CF in league_name.casefold():
                         print(f"     ✅ FOUND BEER LEAGUE!")
                         found_beer_league = True
                 
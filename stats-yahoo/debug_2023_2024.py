@@ -12,14 +12,19 @@ except ImportError:
     print("Error: yahoofantasy package not installed. Run: pip install -r requirements.txt")
     exit(1)
 
+from yahoo_cache import cached_get_leagues, get_ctx
+
 # Load environment variables
 load_dotenv()
 
+TARGET = "Beer League"
+TARGET_CF = TARGET.casefold()
+
 def debug_leagues_for_years():
     """Debug leagues for 2023 and 2024."""
     try:
         print("🔍 Debugging leagues for 2023 and 2024...")
-        ctx = Context()
+        ctx = get_ctx()
         
         for year in [2024, 2023]:
             print(f"\n{'='*50}")
@@ -27,7 +32,7 @@ def debug_leagues_for_years():
             print(f"{'='*50}")
             
             try:
-                leagues = ctx.get_leagues('nfl', year)
+                leagues = cached_get_leagues(ctx, 'nfl', year)
                 print(f"Found {len(leagues)} leagues for {year}")
                 
                 for i, league in enumerate(leagues, 1):
@@ -39,17 +44,13 @@ def debug_leagues_for_years():
                     print(f"   League ID: {league_id}")
                     print(f"   League Key: {league_key}")
                     
-                    # Check if this matches our target
-                    target = "Beer League"
-                    name_lower = str(league_name).lower()
-                    target_lower = target.lower()
+                    # Check if this matches our target (containment either way covers equality)
+                    name_cf = str(league_name).casefold()
                     
-                    if (target_lower in name_lower or 
-                        name_lower in target_lower or
-                        target_lower == name_lower):
-                        print(f"   ✅ MATCHES TARGET: '{target}'")
+                    if TARGET_CF in name_cf or name_cf in TARGET_CF:
+                        print(f"   ✅ MATCHES TARGET: '{TARGET}'")
                     else:
-                        print(f"   ❌ Does not match: '{target}'")
+                        print(f"   ❌ Does not match: '{TARGET}'")
                         
             except Exception as e:
                 print(f"❌ Error getting leagues for {year}: {e}")
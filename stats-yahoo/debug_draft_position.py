@@ -3,7 +3,11 @@
 Debug script to explore team object structure and find draft position data
 """
 
+import io
 import os
+import pprint
+import sys
+import textwrap
 from dotenv import load_dotenv
 
 try:
@@ -12,20 +16,90 @@ except ImportError:
     print("Error: yahoofantasy package not installed. Run: pip install -r requirements.txt")
     exit(1)
 
+from yahoo_cache import cached_draft_results, cached_get_leagues, cached_standings, get_ctx
+
 # Load environment variables
 load_dotenv()
 
-def debug_team_structure():
+# type -> public attribute names mentioning "draft", filled on first use
+_DRAFT_ATTRS_CACHE = {}
+
+def _draft_attrs(obj):
+    """Draft-related attribute names for obj's type, computed once per type."""
+    cls = type(obj)
+    names = _DRAFT_ATTRS_CACHE.get(cls)
+    if names is None:
+        names = tuple(a for a in dir(obj) if not a.startswith('_') and 'draft' in a.lower())
+        _DRAFT_ATTRS_CACHE[cls] = names
+    return names
+
+def _attribute_items(obj, deep=False, include_callables=False, names=None):
+    """Yield (name, value) pairs for an object's public attributes.
+    
+    By default only values already stored on the instance are read, so lazy
+    properties (some of which issue API requests) are never triggered.
+    With deep=True every name from dir() is evaluated, as before.
+    Pass names to restrict either mode to those attributes.
+    """
+    if not deep:
+        instance_attrs = getattr(obj, '__dict__', {})
+        if names is not None:
+            instance_attrs = {a: instance_attrs[a] for a in names if a in instance_attrs}
+        for attr, value in instance_attrs.items():
+            if attr.startswith('_') or (callable(value) and not include_callables):
+                continue
+            yield attr, value
+        return
+    
+    for attr in (dir(obj) if names is None else names):
+        if attr.startswith('_'):
+            continue
+        try:
+            value = getattr(obj, attr)
+        except Exception as e:
+            yield attr, f"<Error accessing: {e}>"
+            continue
+        if callable(value) and not include_callables:
+            continue
+        yield attr, value
+
+def _print_attributes(items, indent="  ", out=None):
+    """Print (name, value) pairs as one pretty-printed dict in a single write."""
+    text = pprint.pformat(dict(items), width=120, sort_dicts=False)
+    (out or sys.stdout).write(textwrap.indent(text, indent) + "\n")
+
+def _dump_team(team, index, deep=False):
+    """Render one team's attribute report and return it as text, so the caller
+    can write all the reports at once."""
+    out = io.StringIO()
+    out.write(f"\n{'='*50}\n")
+    out.write(f"TEAM {index}: {getattr(team, 'name', 'Unknown')}\n")
+    out.write(f"{'='*50}\n")
+    
+    # Print all available attributes
+    out.write("Available attributes:\n")
+    _print_attributes(_attribute_items(team, deep), out=out)
+    
+    # Check team_standings object
+    if hasattr(team, 'team_standings'):
+        out.write(f"\nteam_standings attributes:\n")
+        _print_attributes(_attribute_items(team.team_standings, deep), out=out)
+    
+    # Check if there's draft-related data in the league
+    out.write(f"\nChecking league-level draft data...\n")
+    return out.getvalue()
+
+def debug_team_structure(deep=False):
     """Debug team object structure to find draft position."""
     try:
         print("🔍 Debugging team structure to find draft position...")
-        ctx = Context()
+        ctx = get_ctx()
         
         # Get a recent season with data
         year = 2024
         print(f"\nExploring {year} season...")
         
-        leagues = ctx.get_leagues('nfl', year)
+        leagues = cached_get_leagues(ctx, 'nfl', year)
         target_league = None
         
         # Find Beer League
@@ -41,59 +115,30 @@ def debug_team_structure():
             return
         
         # Get standings
-        standings = target_league.standings()
+        standings = cached_standings(target_league)
         
         print(f"\n📊 Analyzing team objects (found {len(standings)} teams):")
         
-        for i, team in enumerate(standings[:2], 1):  # Just analyze first 2 teams
-            print(f"\n{'='*50}")
-            print(f"TEAM {i}: {getattr(team, 'name', 'Unknown')}")
-            print(f"{'='*50}")
-            
-            # Print all available attributes
-            print("Available attributes:")
-            for attr in dir(team):
-                if not attr.startswith('_'):
-                    try:
-                        value = getattr(team, attr)
-                        if not callable(value):
-                            print(f"  {attr}: {value}")
-                    except Exception as e:
-                        print(f"  {attr}: <Error accessing: {e}>")
-            
-            # Check team_standings object
-            if hasattr(team, 'team_standings'):
-                print(f"\nteam_standings attributes:")
-                for attr in dir(team.team_standings):
-                    if not attr.startswith('_'):
-                        try:
-                            value = getattr(team.team_standings, attr)
-                            if not callable(value):
-                                print(f"  team_standings.{attr}: {value}")
-                        except Exception as e:
-                            print(f"  team_standings.{attr}: <Error accessing: {e}>")
-            
-            # Check if there's draft-related data in the league
-            print(f"\nChecking league-level draft data...")
-            
+        teams = standings[:2]  # Just analyze first 2 teams
+        if teams:
+            # Dumps may trigger API fetches on the shared Context, which is not
+            # thread-safe, so the teams are dumped one after another
+            sys.stdout.write("".join(_dump_team(team, i, deep)
+                                     for i, team in enumerate(teams, 1)))
+        
         # Check league object for draft information
         print(f"\n{'='*50}")
         print("LEAGUE OBJECT ANALYSIS")
         print(f"{'='*50}")
         
         print("League attributes:")
-        for attr in dir(target_league):
-            if not attr.startswith('_') and 'draft' in attr.lower():
-                try:
-                    value = getattr(target_league, attr)
-                    print(f"  {attr}: {value}")
-                except Exception as e:
-                    print(f"  {attr}: <Error accessing: {e}>")
+        _print_attributes(_attribute_items(target_league, deep, include_callables=True,
+                                           names=_draft_attrs(target_league)))
         
         # Try to get draft results if available
         try:
             print(f"\nTrying to access draft results...")
-            draft_results = target_league.draft_results()
+            draft_results = cached_draft_results(target_league)
             print(f"Draft results found! Type: {type(draft_results)}")
             
             if hasattr(draft_results, '__iter__'):
@@ -101,14 +146,7 @@ def debug_team_structure():
                     print(f"Pick {i+1}: {pick}")
                     
                     # Analyze pick object
-                    for attr in dir(pick):
-                        if not attr.startswith('_'):
-                            try:
-                                value = getattr(pick, attr)
-                                if not callable(value):
-                                    print(f"    {attr}: {value}")
-                            except Exception as e:
-                                print(f"    {attr}: <Error: {e}>")
+                    _print_attributes(_attribute_items(pick, deep), indent="    ")
                     print()
                     
         except Exception as e:
@@ -124,13 +162,8 @@ def debug_team_structure():
                 print(f"\nTeam: {team_name}")
                 
                 # Look for draft-related attributes
-                for attr in dir(team):
-                    if 'draft' in attr.lower() and not attr.startswith('_'):
-                        try:
-                            value = getattr(team, attr)
-                            print(f"  {attr}: {value}")
-                        except Exception as e:
-                            print(f"  {attr}: <Error: {e}>")
+                _print_attributes(_attribute_items(team, deep, include_callables=True,
+                                                   names=_draft_attrs(team)))
                             
         except Exception as e:
             print(f"Error exploring alternative methods: {e}")
@@ -139,4 +172,5 @@ def debug_team_structure():
         print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
-    debug_team_structure()
+    # --deep evaluates every attribute via dir(), including lazy API-backed ones
+    debug_team_structure(deep='--deep' in sys.argv[1:])
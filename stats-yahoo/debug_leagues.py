@@ -3,16 +3,16 @@
 Debug script to see what leagues are available
 """
 
-from yahoofantasy import Context
+from yahoo_cache import cached_get_leagues, get_ctx
 
 def debug_leagues():
-    ctx = Context()
+    ctx = get_ctx()
     
     print("Checking available leagues...")
     
     for year in [2024, 2023, 2022, 2021, 2020, 2019, 2018]:
         try:
-            leagues = ctx.get_leagues('nfl', year)
+            leagues = cached_get_leagues(ctx, 'nfl', year)
             print(f"\n=== {year} NFL Leagues ===")
             print(f"Found {len(leagues)} leagues:")
             
@@ -12,6 +12,8 @@ except ImportError:
     print("Error: yahoofantasy package not installed. Run: pip install -r requirements.txt")
     exit(1)
 
+from yahoo_cache import cached_get_leagues, get_ctx
+
 # Load environment variables
 load_dotenv()
 
@@ -19,7 +21,7 @@ def debug_recent_seasons():
     """Find the most recent available NFL seasons."""
     try:
         print("🔍 Testing recent NFL seasons to find what's available...")
-        ctx = Context()
+        ctx = get_ctx()
         
         # Test years from 2025 back to 2020
         for year in range(2025, 2019, -1):
@@ -28,7 +30,7 @@ def debug_recent_seasons():
             print(f"{'='*30}")
             
             try:
-                leagues = ctx.get_leagues('nfl', year)
+                leagues = cached_get_leagues(ctx, 'nfl', year)
                 print(f"✅ SUCCESS: Found {len(leagues)} leagues for {year}")
                 
                 # Show first few leagues as examples
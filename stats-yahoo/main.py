@@ -8,36 +8,68 @@ This is the main entry point for extracting historical data from Yahoo Fantasy l
 import os
 import sys
 import argparse
+import functools
+import json
 import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
 # Add the current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-try:
-    from yahoo_extractor import YahooFantasyExtractor
-    from csv_exporter import CSVExporter
-    from text_formatter import TextFormatter
-except ImportError as e:
-    print(f"Error importing modules: {e}")
-    print("Make sure all required files are in the same directory.")
-    sys.exit(1)
-
 def setup_logging(verbose: bool = False):
     """Set up logging configuration."""
     level = logging.DEBUG if verbose else logging.INFO
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    
+    # The log file is only opened once something is written to it, and records
+    # are batched in memory; errors are written through immediately. Buffered
+    # records are flushed by logging's own shutdown hook at exit.
+    file_handler = logging.FileHandler('extraction.log', delay=True, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
     
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler('extraction.log')
+            buffered_file_handler
         ]
     )
 
+def _load_env_sidecar(env_file: Path) -> bool:
+    """Load .env.json written by setup_auth.py, if it is newer than .env.
+    
+    Mirrors load_dotenv(): values already in the environment are kept.
+    Returns False when the sidecar is missing, stale or unreadable.
+    """
+    json_file = env_file.with_name('.env.json')
+    try:
+        if json_file.stat().st_mtime < env_file.stat().st_mtime:
+            return False  # .env was edited by hand after --configure
+        with open(json_file, encoding='utf-8') as f:
+            values = json.load(f)
+    except (OSError, ValueError):
+        return False
+    
+    for key, value in values.items():
+        os.environ.setdefault(key, str(value))
+    return True
+
+@functools.lru_cache(maxsize=None)
 def check_credentials():
-    """Check if Yahoo API credentials are configured."""
+    """Check if Yahoo API credentials are configured (evaluated once per run)."""
     env_file = Path('.env')
     
     if not env_file.exists():
@@ -49,8 +81,11 @@ def check_credentials():
         return False
     
     # Load and check credentials
-    from dotenv import load_dotenv
-    load_dotenv()
+    if not _load_env_sidecar(env_file):
+        if load_dotenv is None:
+            print("❌ python-dotenv package not installed. Run: pip install -r requirements.txt")
+            return False
+        load_dotenv()
     
     client_id = os.getenv('YAHOO_CLIENT_ID')
     client_secret = os.getenv('YAHOO_CLIENT_SECRET')
@@ -106,16 +141,26 @@ Examples:
         help='Override league ID from environment'
     )
     
+    parser.add_argument(
+        '--allow-substring',
+        action='store_true',
+        help='Match leagues whose key, ID or name merely contains the league ID'
+    )
+    
+    parser.add_argument(
+        '--format',
+        choices=['csv', 'csv.gz', 'parquet'],
+        default='csv',
+        help='File format for rankings and score exports (default: csv; parquet requires pyarrow)'
+    )
+    
     args = parser.parse_args()
     
     # Set up logging
     setup_logging(args.verbose)
     logger = logging.getLogger(__name__)
     
-    print("=" * 60)
-    print("YAHOO FANTASY LEAGUE DATA EXTRACTOR")
-    print("=" * 60)
-    print()
+    sys.stdout.write("\n".join(["=" * 60, "YAHOO FANTASY LEAGUE DATA EXTRACTOR", "=" * 60, "", ""]))
     
     # Check authentication
     if not check_credentials():
@@ -125,6 +170,16 @@ Examples:
         print("✅ Authentication setup is complete!")
         sys.exit(0)
     
+    # Imported here so --help and --check-auth don't pay for yahoofantasy/pandas
+    try:
+        from yahoo_extractor import YahooFantasyExtractor
+        from csv_exporter import CSVExporter
+        from text_formatter import TextFormatter
+    except ImportError as e:
+        print(f"Error importing modules: {e}")
+        print("Make sure all required files are in the same directory.")
+        sys.exit(1)
+    
     # Get league ID
     league_id = args.league_id or os.getenv('LEAGUE_ID')
     
@@ -132,26 +187,37 @@ Examples:
         print(f"🏈 Initializing extractor for league {league_id}...")
         
         # Initialize extractor
-        extractor = YahooFantasyExtractor(league_id)
+        extractor = YahooFantasyExtractor(league_id, allow_substring=args.allow_substring)
         
-        print("📊 Starting data extraction...")
-        print("   This may take several minutes depending on league history...")
-        print()
+        sys.stdout.write("\n".join([
+            "📊 Starting data extraction...",
+            "   This may take several minutes depending on league history...",
+            "", ""
+        ]))
         
         # Extract all data
         rankings, highest_scores, lowest_scores = extractor.extract_all_data()
         
-        print(f"✅ Data extraction complete!")
-        print(f"   - Final rankings: {len(rankings)} records")
-        print(f"   - Highest scores: {len(highest_scores)} records")
-        print(f"   - Lowest scores: {len(lowest_scores)} records")
-        print()
+        sys.stdout.write("\n".join([
+            "✅ Data extraction complete!",
+            f"   - Final rankings: {len(rankings)} records",
+            f"   - Highest scores: {len(highest_scores)} records",
+            f"   - Lowest scores: {len(lowest_scores)} records",
+            "", ""
+        ]))
         
-        # Export to CSV
-        print("💾 Exporting data to CSV files...")
+        # Export to CSV and text at the same time; both only read the extracted
+        # lists and write to different files
+        print("💾 Exporting data to CSV and text files...")
         
         exporter = CSVExporter(args.output_dir)
-        csv_success = exporter.export_all_data(rankings, highest_scores, lowest_scores)
+        formatter = TextFormatter(args.output_dir)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            csv_future = executor.submit(exporter.export_all_data, rankings, highest_scores, lowest_scores, args.format)
+            text_future = executor.submit(formatter.export_all_text_formats, rankings, highest_scores, lowest_scores)
+            csv_success = csv_future.result()
+            text_success = text_future.result()
         
         if csv_success:
             print("✅ CSV export successful!")
@@ -161,12 +227,6 @@ Examples:
         else:
             print("❌ CSV export failed!")
         
-        # Export to text format
-        print("\n📝 Exporting data to text files...")
-        
-        formatter = TextFormatter(args.output_dir)
-        text_success = formatter.export_all_text_formats(rankings, highest_scores, lowest_scores)
-        
         if text_success:
             print("✅ Text export successful!")
         else:
@@ -180,12 +240,18 @@ Examples:
             
             # List text files
             if text_success:
-                text_files = Path(args.output_dir).glob("*.txt")
-                for file in text_files:
-                    print(f"   📄 {file}")
+                with os.scandir(args.output_dir) as entries:
+                    text_lines = [f"   📄 {entry.path}\n" for entry in entries
+                                  if entry.name.endswith('.txt')]
+                sys.stdout.write("".join(text_lines))
         
-        print("\n🎉 Data extraction and export completed successfully!")
-        print(f"\nFiles are available in: {Path(args.output_dir).absolute()}")
+        sys.stdout.write("\n".join([
+            "",
+            "🎉 Data extraction and export completed successfully!",
+            "",
+            f"Files are available in: {os.path.abspath(args.output_dir)}",
+            ""
+        ]))
         
     except KeyboardInterrupt:
         print("\n\n⚠️  Extraction interrupted by user")
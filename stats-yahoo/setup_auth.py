@@ -5,6 +5,7 @@ Yahoo Fantasy API Authentication Setup Guide
 This script helps you set up Yahoo Developer credentials for the fantasy data extractor.
 """
 
+import json
 import os
 import webbrowser
 from pathlib import Path
@@ -70,21 +71,41 @@ def configure_credentials():
         print("Error: Both Client ID and Client Secret are required!")
         return False
     
+    # Offer the league already configured, if any, as the default
+    current_league_id = os.getenv('LEAGUE_ID', '')
+    prompt = f"Enter your Yahoo League ID [{current_league_id}]: " if current_league_id else "Enter your Yahoo League ID: "
+    league_id = input(prompt).strip() or current_league_id
+    
+    if not league_id:
+        print("Error: A League ID is required! It's the number in your league's URL.")
+        return False
+    
     # Create .env file
     env_path = Path(__file__).parent / '.env'
     
+    # JSON copy of the same values; main.py reads it instead of re-parsing .env
+    env_json_path = env_path.with_name('.env.json')
+    env_values = {
+        'YAHOO_CLIENT_ID': client_id,
+        'YAHOO_CLIENT_SECRET': client_secret,
+        'LEAGUE_ID': league_id,
+    }
+    
     env_content = f"""# Yahoo Fantasy API Credentials
 YAHOO_CLIENT_ID={client_id}
 YAHOO_CLIENT_SECRET={client_secret}
 
 # League Configuration
-LEAGUE_ID=848590
+LEAGUE_ID={league_id}
 """
     
     try:
         with open(env_path, 'w') as f:
             f.write(env_content)
         
+        with open(env_json_path, 'w') as f:
+            json.dump(env_values, f)
+        
         print(f"\n✅ Credentials saved to {env_path}")
         print("\nYou can now run the main extractor:")
         print("   python main.py")
@@ -5,11 +5,22 @@ Text Formatter for Yahoo Fantasy League Data
 This module handles formatting extracted data into readable text files.
 """
 
+import heapq
+import io
 import os
 import logging
-from typing import Dict, List
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, List, Optional
 from datetime import datetime
 
+# Target format: #1    Team Name    (W-L-T) (Draft X)
+RANK_WIDTH = 6  # "#1    "
+NAME_WIDTH = 30  # Reduced to make room for draft position
+
+# Bound once so the column widths aren't re-parsed for every record
+_LINE_FMT = f"{{:<{RANK_WIDTH}}}{{:<{NAME_WIDTH}}}{{}}\n".format
+
 class TextFormatter:
     """Format extracted data into text files."""
     
@@ -23,73 +34,73 @@ class TextFormatter:
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
     
-    def format_final_rankings(self, rankings_data: List[Dict]) -> str:
-        """Format final rankings data into readable text format."""
+    def format_final_rankings(self, rankings_data: List[Dict], top_n: Optional[int] = None) -> str:
+        """Format final rankings data into readable text format.
+        
+        If top_n is given, only the top_n most recent seasons are included.
+        """
         if not rankings_data:
             return "No rankings data available."
         
-        # Group rankings by season
-        seasons = {}
+        # Group rankings by season, coercing each rank to an int sort key once
+        seasons = defaultdict(list)
         for record in rankings_data:
-            season = record['season']
-            if season not in seasons:
-                seasons[season] = []
-            seasons[season].append(record)
+            rank = record['rank']
+            rank_key = int(rank) if isinstance(rank, (int, str)) else 0
+            seasons[record['season']].append((rank_key, record))
         
         # Sort seasons in descending order (most recent first)
-        sorted_seasons = sorted(seasons.keys(), reverse=True)
+        if top_n is None:
+            sorted_items = sorted(seasons.items(), key=itemgetter(0), reverse=True)
+        else:
+            sorted_items = heapq.nlargest(top_n, seasons.items(), key=itemgetter(0))
+        sorted_seasons = [season for season, _ in sorted_items]
         
-        output_lines = []
-        output_lines.append("=" * 60)
-        output_lines.append("YAHOO FANTASY LEAGUE - FINAL RANKINGS")
-        output_lines.append("=" * 60)
-        output_lines.append("")
+        buf = io.StringIO()
+        write = buf.write
+        # Hoisted out of the record loop: module globals and the truncation limit
+        line_fmt = _LINE_FMT
+        name_limit = NAME_WIDTH - 1
+        write("=" * 60 + "\n")
+        write("YAHOO FANTASY LEAGUE - FINAL RANKINGS\n")
+        write("=" * 60 + "\n")
+        write("\n")
         
-        for season in sorted_seasons:
-            season_data = seasons[season]
-            # Sort by rank (ensure rank is an integer)
-            season_data.sort(key=lambda x: int(x['rank']) if isinstance(x['rank'], (int, str)) else 0)
+        for season, season_data in sorted_items:
+            season_data.sort(key=itemgetter(0))
+            
+            write(f"SEASON {season}\n")
+            write("-" * 40 + "\n")
             
-            output_lines.append(f"SEASON {season}")
-            output_lines.append("-" * 40)
+            # Unpack the season's records into parallel columns once
+            records = [record for _, record in season_data]
+            ranks = [record['rank'] for record in records]
+            names = [record['team_name'][:name_limit] for record in records]
+            wins = [record.get('wins', 0) for record in records]
+            losses = [record.get('losses', 0) for record in records]
+            ties = [record.get('ties', 0) for record in records]
+            drafts = [record.get('draft_position') for record in records]
             
-            for record in season_data:
-                rank = record['rank']
-                team_name = record['team_name']
-                wins = record.get('wins', 0)
-                losses = record.get('losses', 0)
-                ties = record.get('ties', 0)
-                draft_position = record.get('draft_position')
-                
-                # Format the line similar to the requested format
-                # #1    Team Name    (W-L-T) (Draft X)
-                rank_str = f"#{rank}"
-                record_str = f"({wins}-{losses}-{ties})"
-                draft_str = f"(Draft {draft_position})" if draft_position is not None else ""
-                
-                # Calculate spacing to align records
-                # Target format: #1    Team Name    (W-L-T) (Draft X)
-                rank_width = 6  # "#1    "
-                name_width = 30  # Reduced to make room for draft position
-                
-                # Truncate team name if too long
-                display_name = team_name[:name_width-1] if len(team_name) >= name_width else team_name
-                
-                # Combine record and draft position
-                full_record_str = f"{record_str} {draft_str}".strip()
-                
-                line = f"{rank_str:<{rank_width}}{display_name:<{name_width}}{full_record_str}"
-                output_lines.append(line)
+            # Format the line similar to the requested format
+            # #1    Team Name    (W-L-T) (Draft X)
+            # Team names are truncated by slicing (a no-op for short names) and the
+            # draft suffix is only added when a draft position is known.
+            buf.writelines(
+                line_fmt(f"#{rk}", name,
+                         f"({w}-{l}-{t}) (Draft {dp})" if dp is not None else f"({w}-{l}-{t})")
+                for rk, name, w, l, t, dp in zip(ranks, names, wins, losses, ties, drafts)
+            )
             
-            output_lines.append("")  # Empty line between seasons
+            write("\n")  # Empty line between seasons
         
         # Add footer with extraction info
-        output_lines.append("-" * 60)
-        output_lines.append(f"Extracted on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        output_lines.append(f"Total records: {len(rankings_data)}")
-        output_lines.append(f"Seasons: {', '.join(sorted_seasons)}")
+        write("-" * 60 + "\n")
+        write(f"Extracted on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        total_records = len(rankings_data) if top_n is None else sum(len(data) for _, data in sorted_items)
+        write(f"Total records: {total_records}\n")
+        write(f"Seasons: {', '.join(sorted_seasons)}")
         
-        return "\n".join(output_lines)
+        return buf.getvalue()
     
     def export_rankings_to_text(self, rankings_data: List[Dict], filename: str = "final_rankings.txt") -> bool:
         """Export final rankings to a text file."""
@@ -99,10 +110,17 @@ class TextFormatter:
             # Format the data
             formatted_text = self.format_final_rankings(rankings_data)
             
-            # Write to file
+            # Write to a temp file and rename so readers never see a partial report
             filepath = os.path.join(self.output_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(formatted_text)
+            tmp_path = filepath + ".tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write(formatted_text)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             
             self.logger.info(f"Successfully exported rankings to {filepath}")
             return True
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Yahoo Fantasy League Cache
+
+Caches league listings, standings, weeks and draft results from the Yahoo
+Fantasy API in memory and on disk (without the Context and its
+credentials) so repeated runs don't re-fetch mostly static data.
+"""
+
+import functools
+import io
+import logging
+import os
+import pickle
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Default location; YAHOO_CACHE_DIR overrides it (read per call, after .env is loaded)
+CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+# Listings for the live season can still change (renames, new leagues)
+CURRENT_SEASON_TTL = 3600
+
+# Part of every cache file name; bump it when the on-disk format changes.
+# Format 1 pickled the Context, secrets included, and is no longer read.
+CACHE_FORMAT = 2
+
+# Yahoo answers throttled requests with HTTP 999
+RATE_LIMIT_STATUS = 999
+MAX_BACKOFF_SECONDS = 60
+_RATE_LIMIT_MESSAGE = re.compile(r'\b999\b|rate limit', re.IGNORECASE)
+
+
+class YahooRateLimitError(Exception):
+    """Yahoo kept rate-limiting a request after every retry."""
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) == RATE_LIMIT_STATUS:
+        return True
+    return _RATE_LIMIT_MESSAGE.search(str(error)) is not None
+
+
+def _retry_on_rate_limit(max_attempts: int = 5):
+    """Retry a Yahoo API call with exponential backoff while it is rate-limited.
+    
+    Other errors propagate immediately; once the attempts run out the last
+    rate-limit error is re-raised as YahooRateLimitError.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if not _is_rate_limited(e):
+                        raise
+                    if attempt == max_attempts:
+                        raise YahooRateLimitError(f"Still rate-limited after {max_attempts} attempts: {e}") from e
+                    delay = min(2 ** attempt, MAX_BACKOFF_SECONDS)
+                    logger.warning("Yahoo rate limit hit (%s); retrying in %ss (attempt %s/%s)",
+                                   e, delay, attempt, max_attempts)
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+# The yahoofantasy Context refreshes its token and rewrites its persistence
+# file without any locking, so only one thread may talk to Yahoo at a time.
+# Held per attempt, never across the retry backoff.
+_CTX_LOCK = threading.RLock()
+
+
+@_retry_on_rate_limit()
+def _fetch_leagues(ctx, sport: str, year: int):
+    with _CTX_LOCK:
+        return ctx.get_leagues(sport, year)
+
+
+@_retry_on_rate_limit()
+def _fetch_league_method(league, method: str):
+    with _CTX_LOCK:
+        return getattr(league, method)()
+
+
+def _current_season() -> int:
+    """NFL season currently in progress; the playoffs run into the following year."""
+    now = datetime.now()
+    return now.year if now.month >= 3 else now.year - 1
+
+
+def _cache_dir() -> Path:
+    override = os.getenv('YAHOO_CACHE_DIR')
+    return Path(override).expanduser() if override else CACHE_DIR
+
+
+def _cache_path(sport: str, year: int) -> Path:
+    return _cache_dir() / f"yahoo_leagues_{sport}_{year}.v{CACHE_FORMAT}.pkl"
+
+
+class _DetachedPickler(pickle.Pickler):
+    """Pickle API objects with references to live objects (Context, League) left out.
+    
+    The Context holds the client secret and OAuth tokens, so it must never be
+    written to disk; each reference is stored as its name in `live` instead.
+    """
+
+    def __init__(self, file, live):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        # A missing live object must not turn every None into a reference
+        self._live = {name: obj for name, obj in live.items() if obj is not None}
+
+    def persistent_id(self, obj):
+        for name, live_obj in self._live.items():
+            if obj is live_obj:
+                return name
+        return None
+
+
+class _RebindingUnpickler(pickle.Unpickler):
+    """Unpickle a _DetachedPickler payload, rebinding names to the caller's live objects."""
+
+    def __init__(self, file, live):
+        super().__init__(file)
+        self._live = live
+
+    def persistent_load(self, pid):
+        try:
+            return self._live[pid]
+        except KeyError:
+            raise pickle.UnpicklingError(f"No live object for {pid!r}") from None
+
+
+def _load(path: Path, year: int, live):
+    """Return cached data from disk bound to `live`, or None if missing or stale."""
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        return None
+
+    # Past seasons are frozen, so their listings never go stale
+    if year >= _current_season() and age > CURRENT_SEASON_TTL:
+        return None
+
+    try:
+        with path.open('rb') as f:
+            return _RebindingUnpickler(f, live).load()
+    except Exception as e:
+        logger.debug("Ignoring unreadable league cache %s: %s", path, e)
+        return None
+
+
+def _store(path: Path, leagues, live) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        _DetachedPickler(buffer, live).dump(leagues)
+        path.write_bytes(buffer.getvalue())
+    except Exception as e:
+        # Caching is best-effort; the leagues are still returned to the caller
+        logger.debug("Could not cache leagues to %s: %s", path, e)
+
+
+@functools.lru_cache(maxsize=None)
+def get_ctx():
+    """Shared yahoofantasy Context so repeated calls reuse one authenticated session."""
+    from yahoofantasy import Context
+    return Context()
+
+
+@functools.lru_cache(maxsize=32)
+def cached_get_leagues(ctx, sport: str, year: int):
+    """Get leagues for a sport and year, reusing in-process and on-disk results."""
+    path = _cache_path(sport, year)
+    # Leagues are cached without their Context and rebound to this one on load
+    live = {'ctx': ctx}
+    leagues = _load(path, year, live)
+    if leagues is None:
+        leagues = _fetch_leagues(ctx, sport, year)
+        _store(path, leagues, live)
+    return leagues
+
+
+# (league_key, method) -> result, shared by every caller in the process
+_league_results = {}
+
+
+def _cached_league_call(league, method: str):
+    """Call a no-argument League method once per league key and reuse the result."""
+    league_key = getattr(league, 'league_key', None)
+    if not league_key:
+        return _fetch_league_method(league, method)
+
+    key = (league_key, method)
+    if key in _league_results:
+        return _league_results[key]
+
+    try:
+        year = int(getattr(league, 'season', None))
+    except (TypeError, ValueError):
+        year = _current_season()
+
+    path = _cache_dir() / f"yahoo_{method}_{league_key}.v{CACHE_FORMAT}.pkl"
+    # Results point back at their league and its Context; both are left out of
+    # the file and the caller's league (and its live Context) is bound in on load
+    live = {'ctx': getattr(league, 'ctx', None), 'league': league}
+    result = _load(path, year, live)
+    if result is None:
+        result = _fetch_league_method(league, method)
+        _store(path, result, live)
+
+    _league_results[key] = result
+    return result
+
+
+def cached_standings(league):
+    """League standings, fetched at most once per league key."""
+    return _cached_league_call(league, 'standings')
+
+
+def cached_draft_results(league):
+    """League draft results, fetched at most once per league key."""
+    return _cached_league_call(league, 'draft_results')
+
+
+def cached_weeks(league):
+    """League weeks, fetched at most once per league key."""
+    return _cached_league_call(league, 'weeks')
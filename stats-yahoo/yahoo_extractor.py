@@ -6,10 +6,13 @@ This module handles the extraction of historical data from Yahoo Fantasy leagues
 """
 
 import os
+import sys
 import logging
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
-import time
 
 try:
     from yahoofantasy import Context, League
@@ -17,41 +20,88 @@ except ImportError:
     print("Error: yahoofantasy package not installed. Run: pip install -r requirements.txt")
     exit(1)
 
-from dotenv import load_dotenv
+from yahoo_cache import YahooRateLimitError, cached_get_leagues, cached_standings, cached_weeks, get_ctx
 
-# Load environment variables
-load_dotenv()
+# Environment variables are loaded by the caller (main.check_credentials), which
+# prefers the .env.json written by setup_auth.py over re-parsing .env
+
+# Seasons fetched at once; Yahoo throttles aggressively, so keep this small
+MAX_CONCURRENT_SEASONS = 4
+
+# League fields the target is matched against
+_LEAGUE_MATCH_ATTRS = ('league_key', 'league_id', 'name')
+
+# Team fields read for every ranking row, resolved in C in one call
+_TEAM_FIELDS = attrgetter('name', 'team_key', 'points_for', 'points_against')
+_OUTCOME = attrgetter('wins', 'losses', 'ties')
+
+def weekly_extremes(weekly_scores: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """Split weekly team scores into the highest and lowest score of each (season, week).
+    
+    One pass finds both extremes; ties keep the first team seen.
+    """
+    highest = {}
+    lowest = {}
+    for row in weekly_scores:
+        key = (row['season'], row['week'])
+        points = row['points']
+        if key not in highest or points > highest[key]['points']:
+            highest[key] = row
+        if key not in lowest or points < lowest[key]['points']:
+            lowest[key] = row
+    return list(highest.values()), list(lowest.values())
 
 class YahooFantasyExtractor:
     """Extract historical data from Yahoo Fantasy leagues."""
     
-    def __init__(self, league_id: str):
-        """Initialize the extractor with league ID."""
+    def __init__(self, league_id: str, max_workers: int = MAX_CONCURRENT_SEASONS,
+                 allow_substring: bool = False):
+        """Initialize the extractor with league ID.
+        
+        max_workers bounds how many seasons are extracted at once; 1 extracts
+        them one after another without a thread pool.
+        
+        The league ID must equal a league's key, ID or name (case-insensitive).
+        allow_substring=True restores the old, looser matching where the ID
+        only has to appear somewhere in one of them.
+        """
         self.league_id = league_id
+        self.allow_substring = allow_substring
+        self.max_workers = max(1, max_workers)
+        # Normalized once; every league of every season is compared against it
+        self._target_cf = str(league_id).casefold()
+        # year -> ({normalized league key / id / name: league}, [(league, fields)])
+        self._league_indexes = {}
+        # season -> our League, recorded during season discovery
+        self._league_by_season = {}
         self.client_id = os.getenv('YAHOO_CLIENT_ID')
         self.client_secret = os.getenv('YAHOO_CLIENT_SECRET')
         
         if not self.client_id or not self.client_secret:
             raise ValueError("Yahoo API credentials not found. Run setup_auth.py first.")
         
-        # Set up logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        # Logging is configured by the caller (main.py's setup_logging)
         self.logger = logging.getLogger(__name__)
         
         self.league = None
+        # One timestamp for every row extracted in this run
+        self.refresh_extraction_timestamp()
         self._authenticate()
     
+    def refresh_extraction_timestamp(self):
+        """Restamp rows extracted from now on (for long-lived extractors)."""
+        self._extracted_date = datetime.now().isoformat()
+    
     def _authenticate(self):
         """Authenticate with Yahoo Fantasy API."""
         try:
             self.logger.info("Authenticating with Yahoo Fantasy API...")
             
             # Use the yahoofantasy library's built-in authentication
-            # This will use the stored credentials from 'yahoofantasy login'
-            self.ctx = Context()
+            # This will use the stored credentials from 'yahoofantasy login'.
+            # The Context is shared process-wide so every extractor (and the
+            # league caches keyed on it) reuse one session and its connections.
+            self.ctx = get_ctx()
             
             # Test authentication by trying recent NFL seasons
             # NFL seasons are typically available from 2014 onwards
@@ -60,19 +110,75 @@ class YahooFantasyExtractor:
             for test_year in [2023, 2022, 2021, 2020, 2019]:
                 try:
                     leagues = self.ctx.get_leagues('nfl', test_year)
-                    self.logger.info(f"Authentication successful! Found {len(leagues)} leagues for {test_year}")
+                    self.logger.info("Authentication successful! Found %s leagues for %s", len(leagues), test_year)
                     return
                 except Exception as e:
-                    self.logger.debug(f"Could not get leagues for {test_year}: {e}")
+                    self.logger.debug("Could not get leagues for %s: %s", test_year, e)
                     continue
             
             # If we get here, authentication failed
             raise Exception("Could not authenticate - no valid NFL seasons found")
             
         except Exception as e:
-            self.logger.error(f"Authentication failed: {e}")
+            self.logger.error("Authentication failed: %s", e)
             raise
     
+    @staticmethod
+    def _normalized_fields(league) -> Tuple[str, ...]:
+        """The league's key, ID and name, casefolded (and interned) for matching."""
+        return tuple(sys.intern(str(getattr(league, attr, '')).casefold())
+                     for attr in _LEAGUE_MATCH_ATTRS)
+    
+    def _league_matches(self, league, fields: Optional[Tuple[str, ...]] = None) -> bool:
+        """Check if our target is the league key, ID or name (case-insensitive).
+        
+        With allow_substring the target only has to be contained in one of them.
+        Pass precomputed _normalized_fields to skip re-normalizing the league.
+        """
+        target_cf = self._target_cf
+        fields = fields or self._normalized_fields(league)
+        if not self.allow_substring:
+            return target_cf in fields
+        for field in fields:
+            if target_cf in field:
+                return True
+        return False
+    
+    def _get_leagues_cached(self, year: int):
+        """NFL leagues for a year, fetched once and shared by all the getters."""
+        return cached_get_leagues(self.ctx, 'nfl', int(year))
+    
+    def _league_index(self, year: int) -> Tuple[Dict, List]:
+        """Normalize a year's leagues once.
+        
+        Returns a dict mapping each normalized key, ID and name to its league,
+        and the (league, normalized fields) pairs in API order for substring scans.
+        """
+        year = int(year)
+        cached = self._league_indexes.get(year)
+        if cached is None:
+            index = {}
+            normalized = []
+            for league in self._get_leagues_cached(year):
+                fields = self._normalized_fields(league)
+                normalized.append((league, fields))
+                for field in fields:
+                    # First league wins, as in the linear scan
+                    index.setdefault(field, league)
+            cached = self._league_indexes[year] = (index, normalized)
+        return cached
+    
+    def _resolve_target_league(self, year: int):
+        """Find our league for a year by exact key/ID/name, then substring scan if allowed."""
+        index, normalized = self._league_index(year)
+        league = index.get(self._target_cf)
+        if league is not None or not self.allow_substring:
+            return league
+        for league, fields in normalized:
+            if self._league_matches(league, fields):
+                return league
+        return None
+    
     def get_available_seasons(self) -> List[str]:
         """Get all available seasons for the league."""
         try:
@@ -89,180 +195,148 @@ class YahooFantasyExtractor:
             consecutive_failures = 0
             max_consecutive_failures = 5  # Increased to handle API gaps for recent seasons
             
-            self.logger.info(f"Searching for leagues from {start_year} back to {end_year}")
+            self.logger.info("Searching for leagues from %s back to %s", start_year, end_year)
             self.logger.info("Note: Excluding 2025 season as it's not finished yet")
             
+            # Years are probed one at a time: the Context is shared and not
+            # thread-safe, and the league cache makes repeat runs cheap anyway
             for year in range(start_year, end_year - 1, -1):
                 try:
                     # Get leagues for this year
-                    leagues = self.ctx.get_leagues('nfl', year)
+                    self._get_leagues_cached(year)
                     
                     # Check if our league ID exists in this year
                     found_league = False
-                    for league in leagues:
-                        league_id_str = str(getattr(league, 'league_id', ''))
-                        league_key_str = str(getattr(league, 'league_key', ''))
-                        league_name_str = str(getattr(league, 'name', ''))
-                        
-                        # Check if our target matches league_id, league_key, league_name, or is contained in any (case-insensitive)
-                        target_lower = str(self.league_id).lower()
-                        league_id_lower = league_id_str.lower()
-                        league_key_lower = league_key_str.lower()
-                        league_name_lower = league_name_str.lower()
-                        
-                        if (target_lower == league_key_lower or 
-                            target_lower == league_id_lower or
-                            target_lower == league_name_lower or
-                            target_lower in league_key_lower or 
-                            target_lower in league_id_lower or
-                            target_lower in league_name_lower):
-                            seasons.append(str(year))
-                            self.logger.info(f"Found league for season {year}: '{league_name_str}' ({league_key_str})")
-                            found_league = True
-                            consecutive_failures = 0  # Reset failure counter
-                            break
+                    league = self._resolve_target_league(year)
+                    if league is not None:
+                        seasons.append(str(year))
+                        self._league_by_season[str(year)] = league
+                        self.logger.info("Found league for season %s: '%s' (%s)", year, getattr(league, 'name', ''), getattr(league, 'league_key', ''))
+                        found_league = True
+                        consecutive_failures = 0  # Reset failure counter
                     
                     if not found_league:
                         consecutive_failures += 1
-                        self.logger.debug(f"No matching league found for {year} (consecutive failures: {consecutive_failures})")
+                        self.logger.debug("No matching league found for %s (consecutive failures: %s)", year, consecutive_failures)
                         
                         # If we've had too many consecutive failures and we already found some seasons,
                         # we can assume we've gone back far enough
                         if consecutive_failures >= max_consecutive_failures and len(seasons) > 0:
-                            self.logger.info(f"Stopping search at {year} due to {consecutive_failures} consecutive failures")
+                            self.logger.info("Stopping search at %s due to %s consecutive failures", year, consecutive_failures)
                             break
                             
+                except YahooRateLimitError as e:
+                    # Throttling says nothing about whether the league existed that
+                    # year, so it must not push the search towards stopping early
+                    self.logger.warning("Skipping %s after repeated rate limiting: %s", year, e)
+                    continue
+                    
                 except Exception as e:
                     consecutive_failures += 1
-                    self.logger.debug(f"No league found for {year}: {e} (consecutive failures: {consecutive_failures})")
+                    self.logger.debug("No league found for %s: %s (consecutive failures: %s)", year, e, consecutive_failures)
                     
                     # Same logic for API errors
                     if consecutive_failures >= max_consecutive_failures and len(seasons) > 0:
-                        self.logger.info(f"Stopping search at {year} due to {consecutive_failures} consecutive API failures")
+                        self.logger.info("Stopping search at %s due to %s consecutive API failures", year, consecutive_failures)
                         break
                     continue
             
             # Sort seasons in descending order (most recent first)
             seasons.sort(reverse=True)
-            self.logger.info(f"Found available seasons: {seasons}")
+            self.logger.info("Found available seasons: %s", seasons)
             return seasons
             
         except Exception as e:
-            self.logger.error(f"Error fetching seasons: {e}")
+            self.logger.error("Error fetching seasons: %s", e)
             return []
     
     def get_final_rankings(self, season: str) -> List[Dict]:
         """Get final rankings for a specific season."""
         try:
-            self.logger.info(f"Fetching final rankings for {season} season...")
+            self.logger.info("Fetching final rankings for %s season...", season)
             
-            # Get the league for this specific season
-            leagues = self.ctx.get_leagues('nfl', int(season))
-            target_league = None
-            
-            # Find our specific league
-            for league in leagues:
-                league_id_str = str(getattr(league, 'league_id', ''))
-                league_key_str = str(getattr(league, 'league_key', ''))
-                league_name_str = str(getattr(league, 'name', ''))
-                
-                # Check if our target matches league_id, league_key, league_name, or is contained in any (case-insensitive)
-                target_lower = str(self.league_id).lower()
-                league_id_lower = league_id_str.lower()
-                league_key_lower = league_key_str.lower()
-                league_name_lower = league_name_str.lower()
-                
-                if (target_lower == league_key_lower or 
-                    target_lower == league_id_lower or
-                    target_lower == league_name_lower or
-                    target_lower in league_key_lower or 
-                    target_lower in league_id_lower or
-                    target_lower in league_name_lower):
-                    target_league = league
-                    break
+            # Get our league for this specific season, reusing season discovery's match
+            target_league = self._league_by_season.get(season) or self._resolve_target_league(season)
             
             if not target_league:
-                self.logger.warning(f"League {self.league_id} not found for season {season}")
+                self.logger.warning("League %s not found for season %s", self.league_id, season)
                 return []
             
             # Get standings for this league
-            standings = target_league.standings()
+            standings = cached_standings(target_league)
             
-            rankings = []
-            for i, team in enumerate(standings, 1):
-                # Use the correct API structure for team standings
-                try:
-                    outcomes = team.team_standings.outcome_totals
-                    wins = int(outcomes.wins) if outcomes.wins is not None else 0
-                    losses = int(outcomes.losses) if outcomes.losses is not None else 0
-                    ties = int(outcomes.ties) if outcomes.ties is not None else 0
-                    rank = int(team.team_standings.rank) if team.team_standings.rank is not None else i
-                except (AttributeError, ValueError, TypeError):
-                    # Fallback to basic attributes if the structure is different
-                    wins = getattr(team, 'wins', 0)
-                    losses = getattr(team, 'losses', 0)
-                    ties = getattr(team, 'ties', 0)
-                    rank = i
-                
-                # Get draft position if available
-                draft_position = getattr(team, 'draft_position', None)
-                
-                ranking_data = {
-                    'season': season,
-                    'rank': rank,
-                    'team_name': getattr(team, 'name', f'Team {i}'),
-                    'team_key': getattr(team, 'team_key', ''),
-                    'wins': wins,
-                    'losses': losses,
-                    'ties': ties,
-                    'draft_position': int(draft_position) if draft_position is not None else None,
-                    'points_for': getattr(team, 'points_for', 0),
-                    'points_against': getattr(team, 'points_against', 0),
-                    'extracted_date': datetime.now().isoformat()
-                }
-                rankings.append(ranking_data)
+            rankings = [self._team_to_dict(team, i, season) for i, team in enumerate(standings, 1)]
             
-            self.logger.info(f"Extracted {len(rankings)} team rankings for {season}")
+            self.logger.info("Extracted %s team rankings for %s", len(rankings), season)
             return rankings
             
         except Exception as e:
-            self.logger.error(f"Error fetching rankings for {season}: {e}")
+            self.logger.error("Error fetching rankings for %s: %s", season, e)
             return []
     
-    def get_highest_scores(self, season: str) -> List[Dict]:
-        """Get highest weekly scores for a specific season."""
+    def _team_to_dict(self, team, i: int, season: str) -> Dict:
+        """Build one ranking row; i is the team's 1-based position in the standings."""
+        # Use the correct API structure for team standings
         try:
-            self.logger.info(f"Fetching highest scores for {season} season...")
-            
-            # Get the league for this specific season
-            leagues = self.ctx.get_leagues('nfl', int(season))
-            target_league = None
+            team_standings = team.team_standings
+            wins, losses, ties = _OUTCOME(team_standings.outcome_totals)
+            wins = int(wins) if wins is not None else 0
+            losses = int(losses) if losses is not None else 0
+            ties = int(ties) if ties is not None else 0
+            rank = int(team_standings.rank) if team_standings.rank is not None else i
+        except (AttributeError, ValueError, TypeError):
+            # Fallback to basic attributes if the structure is different
+            wins = getattr(team, 'wins', 0)
+            losses = getattr(team, 'losses', 0)
+            ties = getattr(team, 'ties', 0)
+            rank = i
+        
+        try:
+            name, team_key, points_for, points_against = _TEAM_FIELDS(team)
+        except AttributeError:
+            # Not every team object carries all fields; use the defaults
+            name = getattr(team, 'name', f'Team {i}')
+            team_key = getattr(team, 'team_key', '')
+            points_for = getattr(team, 'points_for', 0)
+            points_against = getattr(team, 'points_against', 0)
+        
+        # Get draft position if available
+        draft_position = getattr(team, 'draft_position', None)
+        
+        return {
+            'season': season,
+            'rank': rank,
+            'team_name': name,
+            'team_key': team_key,
+            'wins': wins,
+            'losses': losses,
+            'ties': ties,
+            'draft_position': int(draft_position) if draft_position is not None else None,
+            'points_for': points_for,
+            'points_against': points_against,
+            'extracted_date': self._extracted_date
+        }
+    
+    def get_weekly_scores(self, season: str) -> List[Dict]:
+        """Get every team's score for every week of a specific season."""
+        try:
+            self.logger.info("Fetching weekly scores for %s season...", season)
             
-            # Find our specific league
-            for league in leagues:
-                league_id_str = str(getattr(league, 'league_id', ''))
-                league_key_str = str(getattr(league, 'league_key', ''))
-                
-                # Check if our target matches either the league_id, league_key, or is contained in either
-                if (str(self.league_id) == league_key_str or 
-                    str(self.league_id) == league_id_str or
-                    str(self.league_id) in league_key_str or 
-                    str(self.league_id) in league_id_str):
-                    target_league = league
-                    break
+            # Get our league for this specific season, reusing season discovery's match
+            target_league = self._league_by_season.get(season) or self._resolve_target_league(season)
             
             if not target_league:
-                self.logger.warning(f"League {self.league_id} not found for season {season}")
+                self.logger.warning("League %s not found for season %s", self.league_id, season)
                 return []
             
-            highest_scores = []
+            weekly_scores = []
             
             # Get available weeks for this league
             try:
-                weeks = target_league.weeks()
-                self.logger.info(f"Found {len(weeks)} weeks for season {season}")
+                weeks = cached_weeks(target_league)
+                self.logger.info("Found %s weeks for season %s", len(weeks), season)
             except Exception as e:
-                self.logger.warning(f"Could not get weeks for {season}: {e}")
+                self.logger.warning("Could not get weeks for %s: %s", season, e)
                 # Fallback to standard NFL weeks
                 weeks = list(range(1, 18))
             
@@ -272,98 +346,91 @@ class YahooFantasyExtractor:
                     
                     # For now, we'll skip scoreboard extraction as it requires more complex API calls
                     # This is a placeholder for future implementation
-                    self.logger.debug(f"Skipping scoreboard for week {week_number} - needs implementation")
-                    
-                    # Rate limiting
-                    time.sleep(0.1)
+                    self.logger.debug("Skipping scoreboard for week %s - needs implementation", week_number)
                     
                 except Exception as e:
-                    self.logger.warning(f"Could not process week {week_num} for {season}: {e}")
+                    self.logger.warning("Could not process week %s for %s: %s", week_num, season, e)
                     continue
             
-            self.logger.info(f"Extracted {len(highest_scores)} highest weekly scores for {season}")
-            return highest_scores
+            self.logger.info("Extracted %s weekly team scores for %s", len(weekly_scores), season)
+            return weekly_scores
             
         except Exception as e:
-            self.logger.error(f"Error fetching highest scores for {season}: {e}")
+            self.logger.error("Error fetching weekly scores for %s: %s", season, e)
             return []
     
+    def get_highest_scores(self, season: str) -> List[Dict]:
+        """Get highest weekly scores for a specific season."""
+        highest_scores, _ = weekly_extremes(self.get_weekly_scores(season))
+        self.logger.info("Extracted %s highest weekly scores for %s", len(highest_scores), season)
+        return highest_scores
+    
     def get_lowest_scores(self, season: str) -> List[Dict]:
         """Get lowest weekly scores for a specific season."""
-        try:
-            self.logger.info(f"Fetching lowest scores for {season} season...")
-            
-            # Get the league for this specific season
-            leagues = self.ctx.get_leagues('nfl', int(season))
-            target_league = None
-            
-            # Find our specific league
-            for league in leagues:
-                if str(self.league_id) in league.league_id:
-                    target_league = league
-                    break
-            
-            if not target_league:
-                self.logger.warning(f"League {self.league_id} not found for season {season}")
-                return []
-            
-            lowest_scores = []
-            
-            # Get available weeks for this league
-            try:
-                weeks = target_league.weeks()
-                self.logger.info(f"Found {len(weeks)} weeks for season {season}")
-            except Exception as e:
-                self.logger.warning(f"Could not get weeks for {season}: {e}")
-                # Fallback to standard NFL weeks
-                weeks = list(range(1, 18))
-            
-            for week_num in (weeks if isinstance(weeks, list) else range(1, 18)):
-                try:
-                    week_number = week_num if isinstance(week_num, int) else getattr(week_num, 'week', week_num)
-                    
-                    # For now, we'll skip scoreboard extraction as it requires more complex API calls
-                    # This is a placeholder for future implementation
-                    self.logger.debug(f"Skipping scoreboard for week {week_number} - needs implementation")
-                    
-                    # Rate limiting
-                    time.sleep(0.1)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Could not process week {week_num} for {season}: {e}")
-                    continue
-            
-            self.logger.info(f"Extracted {len(lowest_scores)} lowest weekly scores for {season}")
-            return lowest_scores
-            
-        except Exception as e:
-            self.logger.error(f"Error fetching lowest scores for {season}: {e}")
-            return []
+        _, lowest_scores = weekly_extremes(self.get_weekly_scores(season))
+        self.logger.info("Extracted %s lowest weekly scores for %s", len(lowest_scores), season)
+        return lowest_scores
     
-    def extract_all_data(self) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-        """Extract all historical data for the league."""
+    def _extract_one_season(self, season: str) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """Extract rankings, highest and lowest scores for one season."""
+        self.logger.info("Processing season %s...", season)
+        
+        rankings = self.get_final_rankings(season)
+        # One fetch of the weekly scoreboards yields both extremes
+        highest, lowest = weekly_extremes(self.get_weekly_scores(season))
+        self.logger.info("Extracted %s highest and %s lowest weekly scores for %s", len(highest), len(lowest), season)
+        return rankings, highest, lowest
+    
+    def iter_extract_all_data(self) -> Iterator[Tuple[str, str, Dict]]:
+        """Yield (category, season, row) for all historical data, one season at a time.
+        
+        category is 'rankings', 'highest_scores' or 'lowest_scores'. Seasons are
+        yielded newest first, as soon as each one (and those before it) is done.
+        """
         self.logger.info("Starting full data extraction...")
         
         seasons = self.get_available_seasons()
         
-        all_rankings = []
-        all_highest_scores = []
-        all_lowest_scores = []
-        
-        for season in seasons:
-            self.logger.info(f"Processing season {season}...")
-            
-            # Extract data for this season
-            rankings = self.get_final_rankings(season)
-            highest = self.get_highest_scores(season)
-            lowest = self.get_lowest_scores(season)
-            
-            all_rankings.extend(rankings)
-            all_highest_scores.extend(highest)
-            all_lowest_scores.extend(lowest)
-            
-            # Rate limiting between seasons
-            time.sleep(1)
+        # Seasons are independent, so a few are processed at a time; the Yahoo
+        # calls themselves are serialized in yahoo_cache because the shared
+        # Context is not thread-safe
+        if self.max_workers == 1:
+            yield from self._yield_season_rows(seasons, map(self._extract_one_season, seasons))
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                yield from self._yield_season_rows(seasons, self._windowed_results(executor, seasons))
         
         self.logger.info("Data extraction complete!")
-        return all_rankings, all_highest_scores, all_lowest_scores
+    
+    def _windowed_results(self, executor, seasons) -> Iterator[Tuple[List[Dict], List[Dict], List[Dict]]]:
+        """Yield each season's results in order, with at most max_workers seasons in flight.
+        
+        Unlike executor.map, which submits every season up front, a new season is
+        only submitted once the oldest one has been handed on, so neither the queue
+        nor the finished-but-unyielded results grow with the number of seasons.
+        """
+        pending = deque()
+        for season in seasons:
+            pending.append(executor.submit(self._extract_one_season, season))
+            if len(pending) >= self.max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    
+    @staticmethod
+    def _yield_season_rows(seasons, results) -> Iterator[Tuple[str, str, Dict]]:
+        """Flatten per-season (rankings, highest, lowest) results into tagged rows."""
+        for season, (rankings, highest, lowest) in zip(seasons, results):
+            for row in rankings:
+                yield 'rankings', season, row
+            for row in highest:
+                yield 'highest_scores', season, row
+            for row in lowest:
+                yield 'lowest_scores', season, row
+    
+    def extract_all_data(self) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """Extract all historical data for the league."""
+        collected = {'rankings': [], 'highest_scores': [], 'lowest_scores': []}
+        for category, _, row in self.iter_extract_all_data():
+            collected[category].append(row)
+        return collected['rankings'], collected['highest_scores'], collected['lowest_scores']